@@ -3,6 +3,7 @@
 import os
 import platform
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 # User data directory — all user-specific files live here
@@ -55,7 +56,7 @@ def get_chrome_path() -> str:
     else:  # Linux
         candidates = []
         for name in ("google-chrome", "google-chrome-stable", "chromium-browser", "chromium"):
-            found = shutil.which(name)
+            found = which(name)
             if found:
                 candidates.append(Path(found))
 
@@ -65,7 +66,7 @@ def get_chrome_path() -> str:
 
     # Fall back to PATH search
     for name in ("google-chrome", "google-chrome-stable", "chromium-browser", "chromium", "chrome"):
-        found = shutil.which(name)
+        found = which(name)
         if found:
             return found
 
@@ -101,25 +102,29 @@ def load_profile() -> dict:
     return json.loads(PROFILE_PATH.read_text(encoding="utf-8"))
 
 
+def yaml_safe_load(text: str):
+    """yaml.safe_load(), parsed by libyaml's C loader when PyYAML was built with it."""
+    import yaml
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
 def load_search_config() -> dict:
     """Load search configuration from ~/.applypilot/searches.yaml."""
-    import yaml
     if not SEARCH_CONFIG_PATH.exists():
         # Fall back to package-shipped example
         example = CONFIG_DIR / "searches.example.yaml"
         if example.exists():
-            return yaml.safe_load(example.read_text(encoding="utf-8"))
+            return yaml_safe_load(example.read_text(encoding="utf-8"))
         return {}
-    return yaml.safe_load(SEARCH_CONFIG_PATH.read_text(encoding="utf-8"))
+    return yaml_safe_load(SEARCH_CONFIG_PATH.read_text(encoding="utf-8"))
 
 
 def load_sites_config() -> dict:
     """Load sites.yaml configuration (sites list, manual_ats, blocked, etc.)."""
-    import yaml
     path = CONFIG_DIR / "sites.yaml"
     if not path.exists():
         return {}
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return yaml_safe_load(path.read_text(encoding="utf-8")) or {}
 
 
 def is_manual_ats(url: str | None) -> bool:
@@ -225,6 +230,21 @@ TIER_COMMANDS: dict[int, list[str]] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _which_on(name: str, search_path: str) -> str | None:
+    return shutil.which(name, path=search_path)
+
+
+def which(name: str) -> str | None:
+    """shutil.which(), cached per PATH value.
+
+    Each lookup stats every PATH entry; tier checks and the setup wizard probe
+    the same few tools repeatedly. Changing PATH (e.g. via .env) misses the
+    cache, so newly exposed tools are still found.
+    """
+    return _which_on(name, os.environ.get("PATH", os.defpath))
+
+
 def get_tier() -> int:
     """Detect the current tier based on available dependencies.
 
@@ -234,7 +254,7 @@ def get_tier() -> int:
     """
     load_env()
 
-    has_gemini_cli = shutil.which("gemini") is not None
+    has_gemini_cli = which("gemini") is not None
     if not has_gemini_cli:
         return 1
 
@@ -252,7 +272,7 @@ def check_tier(required: int, feature: str) -> None:
     if required <= 2 and current >= required:
         return
 
-    has_claude = shutil.which("claude") is not None
+    has_claude = which("claude") is not None
     try:
         get_chrome_path()
         has_chrome = True
@@ -266,7 +286,7 @@ def check_tier(required: int, feature: str) -> None:
     _console = Console(stderr=True)
 
     missing: list[str] = []
-    if required >= 2 and shutil.which("gemini") is None:
+    if required >= 2 and which("gemini") is None:
         missing.append("Gemini CLI not found, install from [bold]https://github.com/google-gemini/gemini-cli[/bold]")
     if required >= 3:
         if not has_claude:
@@ -53,6 +53,35 @@ def get_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
     return conn
 
 
+def get_read_only_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
+    """Open a separate read-only connection for reporting queries.
+
+    Unlike get_connection() this is not cached; the caller closes it. It never
+    takes write locks, and with the database in WAL mode it reads alongside
+    running pipeline stages. Sorts and temp tables stay in memory and pages
+    are memory-mapped. Since the connection is private to the caller, it may
+    be handed to a helper thread (e.g. to prefetch rows).
+
+    Args:
+        db_path: Override the default DB_PATH.
+
+    Returns:
+        sqlite3.Connection opened with mode=ro and row factory.
+    """
+    path = Path(db_path or DB_PATH).resolve()
+    conn = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA busy_timeout=10000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def dict_row_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """Row factory that builds plain dicts straight from the cursor description."""
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+
 def close_connection(db_path: Path | str | None = None) -> None:
     """Close the cached connection for the current thread."""
     path = str(db_path or DB_PATH)
@@ -140,6 +169,24 @@ def init_db(db_path: Path | str | None = None) -> sqlite3.Connection:
     # Run migrations for any columns added after initial schema
     ensure_columns(conn)
 
+    # Indexes for the dashboard: the score-ordered job listing walks the first
+    # one instead of sorting, and the per-site breakdown groups off the second.
+    # The partial path indexes back the generated-documents listing.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_fit_score_site_title "
+        "ON jobs(fit_score DESC, site, title)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_site_fit ON jobs(site, fit_score)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_tailored_resume_path "
+        "ON jobs(tailored_resume_path) WHERE tailored_resume_path IS NOT NULL"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_cover_letter_path "
+        "ON jobs(cover_letter_path) WHERE cover_letter_path IS NOT NULL"
+    )
+    conn.commit()
+
     return conn
 
 
@@ -419,10 +466,6 @@ def get_jobs_by_stage(conn: sqlite3.Connection | None = None,
         query += " LIMIT ?"
         params.append(limit)
 
-    rows = conn.execute(query, params).fetchall()
-
-    # Convert sqlite3.Row objects to dicts
-    if rows:
-        columns = rows[0].keys()
-        return [dict(zip(columns, row)) for row in rows]
-    return []
+    cursor = conn.cursor()
+    cursor.row_factory = dict_row_factory
+    return cursor.execute(query, params).fetchall()
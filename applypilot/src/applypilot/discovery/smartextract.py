@@ -24,7 +24,6 @@ from pathlib import Path
 from urllib.parse import quote_plus
 
 import httpx
-import yaml
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
@@ -81,7 +80,7 @@ def load_sites() -> list[dict]:
     if not path.exists():
         log.warning("sites.yaml not found at %s", path)
         return []
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = config.yaml_safe_load(path.read_text(encoding="utf-8"))
     return data.get("sites", [])
 
 
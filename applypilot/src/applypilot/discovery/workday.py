@@ -17,8 +17,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from html.parser import HTMLParser
 
-import yaml
-
 from applypilot import config
 from applypilot.config import CONFIG_DIR
 from applypilot.database import get_connection, init_db
@@ -34,7 +32,7 @@ def load_employers() -> dict:
     if not path.exists():
         log.warning("employers.yaml not found at %s", path)
         return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = config.yaml_safe_load(path.read_text(encoding="utf-8"))
     return data.get("employers", {})
 
 
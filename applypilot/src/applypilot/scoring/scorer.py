@@ -6,19 +6,32 @@ profile and resume file.
 """
 
 import logging
+import queue
 import re
 import threading
 import time
 from collections import deque
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from applypilot.config import RESUME_PATH
-from applypilot.database import get_connection, get_jobs_by_stage
+from applypilot.database import dict_row_factory, get_connection
 from applypilot.llm import get_client
 
 log = logging.getLogger(__name__)
 _MAX_REQUESTS_PER_MINUTE = 10
+_SCORE_RE = re.compile(r"\d+")
+_MAX_DESCRIPTION_CHARS = 6000
+
+# Per-thread LLM client so each scoring worker resolves its client once.
+_tls = threading.local()
+
+# Only the columns score_job needs; the description is clipped by SQLite so
+# oversized postings never get copied into Python in full.
+_SCORE_COLUMNS = (
+    "url, title, site, location, "
+    f"substr(full_description, 1, {_MAX_DESCRIPTION_CHARS}) AS full_description"
+)
 
 
 class _SlidingWindowRateLimiter:
@@ -27,13 +40,12 @@ class _SlidingWindowRateLimiter:
     def __init__(self, max_calls: int, window_seconds: float):
         self.max_calls = max_calls
         self.window_seconds = window_seconds
-        self._lock = threading.Lock()
+        self._cond = threading.Condition()
         self._timestamps: deque[float] = deque()
 
     def acquire(self) -> None:
-        while True:
-            wait_seconds = 0.0
-            with self._lock:
+        with self._cond:
+            while True:
                 now = time.monotonic()
                 cutoff = now - self.window_seconds
                 while self._timestamps and self._timestamps[0] <= cutoff:
@@ -41,9 +53,9 @@ class _SlidingWindowRateLimiter:
                 if len(self._timestamps) < self.max_calls:
                     self._timestamps.append(now)
                     return
-                wait_seconds = (self._timestamps[0] + self.window_seconds) - now
-            if wait_seconds > 0:
-                time.sleep(wait_seconds)
+                # Sleep until the oldest slot expires; the condition releases
+                # the lock while waiting so other threads can still check in.
+                self._cond.wait(timeout=(self._timestamps[0] + self.window_seconds) - now)
 
 
 def _score_job_task(resume_text: str, job: dict, limiter: _SlidingWindowRateLimiter) -> tuple[dict, dict]:
@@ -87,18 +99,25 @@ def _parse_score_response(response: str) -> dict:
     keywords = ""
     reasoning = response
 
-    for line in response.split("\n"):
-        line = line.strip()
-        if line.startswith("SCORE:"):
-            try:
-                score = int(re.search(r"\d+", line).group())
-                score = max(1, min(10, score))
-            except (AttributeError, ValueError):
-                score = None
-        elif line.startswith("KEYWORDS:"):
-            keywords = line.replace("KEYWORDS:", "").strip()
-        elif line.startswith("REASONING:"):
-            reasoning = line.replace("REASONING:", "").strip()
+    # The prompt pins the three fields to a fixed order, so peel them off
+    # in sequence rather than splitting and scanning every line.
+    _, found, rest = response.partition("SCORE:")
+    if found:
+        score_line, _, rest = rest.partition("\n")
+        match = _SCORE_RE.search(score_line)
+        if match:
+            score = max(1, min(10, int(match.group())))
+    else:
+        rest = response
+
+    _, found, after = rest.partition("KEYWORDS:")
+    if found:
+        keywords_line, _, rest = after.partition("\n")
+        keywords = keywords_line.strip()
+
+    _, found, after = rest.partition("REASONING:")
+    if found:
+        reasoning = after.partition("\n")[0].strip()
 
     return {"score": score, "keywords": keywords, "reasoning": reasoning}
 
@@ -109,6 +128,7 @@ def score_job(resume_text: str, job: dict) -> dict:
     Args:
         resume_text: The candidate's full resume text.
         job: Job dict with keys: title, site, location, full_description.
+            The description is expected to be pre-clipped (see _SCORE_COLUMNS).
 
     Returns:
         {"score": int, "keywords": str, "reasoning": str}
@@ -117,7 +137,7 @@ def score_job(resume_text: str, job: dict) -> dict:
         f"TITLE: {job['title']}\n"
         f"COMPANY: {job['site']}\n"
         f"LOCATION: {job.get('location', 'N/A')}\n\n"
-        f"DESCRIPTION:\n{(job.get('full_description') or '')[:6000]}"
+        f"DESCRIPTION:\n{job.get('full_description') or ''}"
     )
 
     messages = [
@@ -126,7 +146,9 @@ def score_job(resume_text: str, job: dict) -> dict:
     ]
 
     try:
-        client = get_client()
+        client = getattr(_tls, "client", None)
+        if client is None:
+            client = _tls.client = get_client()
         response = client.chat(messages, max_tokens=512, temperature=0.2)
         parsed = _parse_score_response(response)
         if parsed["score"] is None:
@@ -176,25 +198,21 @@ def run_scoring(limit: int = 0, rescore: bool = False, workers: int = 10) -> dic
     conn = get_connection()
 
     try:
-        if rescore:
-            query = "SELECT * FROM jobs WHERE full_description IS NOT NULL"
-            params = []
-            if limit > 0:
-                query += " LIMIT ?"
-                params.append(limit)
-            jobs = conn.execute(query, params).fetchall()
-        else:
-            jobs = get_jobs_by_stage(conn=conn, stage="pending_score", limit=limit)
+        query = f"SELECT {_SCORE_COLUMNS} FROM jobs WHERE full_description IS NOT NULL"
+        if not rescore:
+            query += " AND fit_score IS NULL ORDER BY discovered_at DESC"
+        params = []
+        if limit > 0:
+            query += " LIMIT ?"
+            params.append(limit)
+        cursor = conn.cursor()
+        cursor.row_factory = dict_row_factory
+        jobs = cursor.execute(query, params).fetchall()
 
         if not jobs:
             log.info("No unscored jobs with descriptions found.")
             return {"scored": 0, "errors": 0, "elapsed": 0.0, "distribution": []}
 
-        # Convert sqlite3.Row to dicts if needed
-        if jobs and not isinstance(jobs[0], dict):
-            columns = jobs[0].keys()
-            jobs = [dict(zip(columns, row)) for row in jobs]
-
         log.info(
             "Scoring %d jobs with %d worker(s), rate-limited to %d requests/min...",
             len(jobs), workers, _MAX_REQUESTS_PER_MINUTE,
@@ -208,7 +226,10 @@ def run_scoring(limit: int = 0, rescore: bool = False, workers: int = 10) -> dic
 
         with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="score-worker") as executor:
             jobs_iter = iter(jobs)
-            inflight: dict = {}
+            inflight: set = set()
+            # Workers push finished futures here, so each completion is O(1)
+            # instead of re-waiting on every in-flight future.
+            finished: queue.SimpleQueue = queue.SimpleQueue()
 
             def submit_next() -> bool:
                 try:
@@ -216,7 +237,8 @@ def run_scoring(limit: int = 0, rescore: bool = False, workers: int = 10) -> dic
                 except StopIteration:
                     return False
                 future = executor.submit(_score_job_task, resume_text, next_job, limiter)
-                inflight[future] = True
+                inflight.add(future)
+                future.add_done_callback(finished.put)
                 return True
 
             initial_launches = min(workers, len(jobs))
@@ -227,51 +249,49 @@ def run_scoring(limit: int = 0, rescore: bool = False, workers: int = 10) -> dic
                     time.sleep(1.0)
 
             while inflight:
-                done, _ = wait(tuple(inflight.keys()), return_when=FIRST_COMPLETED)
-                for fut in done:
-                    inflight.pop(fut, None)
-                    try:
-                        job, result = fut.result()
-                    except Exception as exc:
-                        completed += 1
-                        errors += 1
-                        log.error("[%d/%d] score=ERR  worker failure | %s", completed, len(jobs), str(exc)[:240])
-                        if fatal_error is None:
-                            submit_next()
-                        continue
-
+                fut = finished.get()
+                inflight.discard(fut)
+                try:
+                    job, result = fut.result()
+                except Exception as exc:
                     completed += 1
-                    score_value = result.get("score")
-                    if isinstance(score_value, int) and 1 <= score_value <= 10:
-                        now = datetime.now(timezone.utc).isoformat()
-                        conn.execute(
-                            "UPDATE jobs SET fit_score = ?, score_reasoning = ?, scored_at = ? WHERE url = ?",
-                            (score_value, f"{result['keywords']}\n{result['reasoning']}", now, job["url"]),
-                        )
-                        conn.commit()
-                        scored += 1
-                        log.info(
-                            "[%d/%d] score=%d  %s",
-                            completed, len(jobs), score_value, job.get("title", "?")[:60],
-                        )
-                    else:
-                        errors += 1
-                        log.error(
-                            "[%d/%d] score=ERR  %s | %s",
-                            completed, len(jobs), job.get("title", "?")[:60], result.get("reasoning", "unknown error")[:240],
-                        )
-                        if result.get("fatal") and fatal_error is None:
-                            fatal_error = RuntimeError(
-                                "Scoring aborted due to Gemini quota/auth error. "
-                                "Fix Gemini CLI access or model availability, then re-run score."
-                            )
-
+                    errors += 1
+                    log.error("[%d/%d] score=ERR  worker failure | %s", completed, len(jobs), str(exc)[:240])
                     if fatal_error is None:
                         submit_next()
+                    continue
+
+                completed += 1
+                score_value = result.get("score")
+                if isinstance(score_value, int) and 1 <= score_value <= 10:
+                    now = datetime.now(timezone.utc).isoformat()
+                    conn.execute(
+                        "UPDATE jobs SET fit_score = ?, score_reasoning = ?, scored_at = ? WHERE url = ?",
+                        (score_value, f"{result['keywords']}\n{result['reasoning']}", now, job["url"]),
+                    )
+                    conn.commit()
+                    scored += 1
+                    log.info(
+                        "[%d/%d] score=%d  %s",
+                        completed, len(jobs), score_value, job.get("title", "?")[:60],
+                    )
+                else:
+                    errors += 1
+                    log.error(
+                        "[%d/%d] score=ERR  %s | %s",
+                        completed, len(jobs), job.get("title", "?")[:60], result.get("reasoning", "unknown error")[:240],
+                    )
+                    if result.get("fatal") and fatal_error is None:
+                        fatal_error = RuntimeError(
+                            "Scoring aborted due to Gemini quota/auth error. "
+                            "Fix Gemini CLI access or model availability, then re-run score."
+                        )
 
-                if fatal_error is not None:
-                    for fut in list(inflight.keys()):
-                        fut.cancel()
+                if fatal_error is None:
+                    submit_next()
+                else:
+                    for pending in inflight:
+                        pending.cancel()
                     break
 
         if fatal_error is not None:
@@ -5,15 +5,21 @@ a profile dict (from applypilot.config.load_profile()) and validates against the
 actual skills, companies, projects, and school.
 """
 
-import re
+import functools
 import logging
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import NamedTuple
 
 log = logging.getLogger(__name__)
 
 
 # ── Universal Constants (not personal data) ───────────────────────────────
 
-BANNED_WORDS: list[str] = [
+BANNED_WORDS: tuple[str, ...] = (
     "passionate", "dedicated", "committed to",
     "utilizing", "utilize", "harnessing",
     "spearheaded", "spearhead", "orchestrated", "championed", "pioneered",
@@ -32,9 +38,9 @@ BANNED_WORDS: list[str] = [
     # Cover-letter-specific additions
     "this demonstrates", "this reflects", "i have experience with",
     "furthermore", "additionally", "moreover",
-]
+)
 
-LLM_LEAK_PHRASES: list[str] = [
+LLM_LEAK_PHRASES: tuple[str, ...] = (
     "i am sorry", "i apologize", "i will try", "let me try",
     "i am at a loss", "i am truly sorry", "apologies for",
     "i keep fabricating", "i will have to admit", "one final attempt",
@@ -48,11 +54,11 @@ LLM_LEAK_PHRASES: list[str] = [
     "per your feedback", "based on your feedback", "as per the instructions",
     "the following resume", "the resume below",
     "the following cover letter", "the letter below",
-]
+)
 
 # Known fabrication markers: completely unrelated tools/languages.
 # Reasonable stretches (K8s, Terraform, Redis, Kafka etc.) are ALLOWED.
-FABRICATION_WATCHLIST: set[str] = {
+FABRICATION_WATCHLIST: frozenset[str] = frozenset({
     # Languages with zero relation to the candidate's stack
     "c#", "c++", "golang", "rust", "ruby",
     "kotlin", "swift", "scala", "matlab",
@@ -60,9 +66,199 @@ FABRICATION_WATCHLIST: set[str] = {
     "spring", "django", "rails", "angular", "vue", "svelte",
     # Hard lies: certifications can't be stretched
     "certif", "certified", "pmp", "scrum master", "aws certified",
+})
+
+REQUIRED_SECTIONS: frozenset[str] = frozenset({"SUMMARY", "TECHNICAL SKILLS", "EXPERIENCE", "PROJECTS", "EDUCATION"})
+
+# Headings accepted for each required section (lower-case substring match).
+SECTION_VARIANTS: dict[str, tuple[str, ...]] = {
+    "SUMMARY": ("summary", "professional summary", "profile"),
+    "TECHNICAL SKILLS": ("technical skills", "skills", "tech stack", "core skills", "technologies"),
+    "EXPERIENCE": ("experience", "work experience", "professional experience"),
+    "PROJECTS": ("projects", "personal projects", "key projects", "selected projects"),
+    "EDUCATION": ("education", "academic background"),
 }
 
-REQUIRED_SECTIONS: set[str] = {"SUMMARY", "TECHNICAL SKILLS", "EXPERIENCE", "PROJECTS", "EDUCATION"}
+
+# ── Term Matching ─────────────────────────────────────────────────────────
+
+def _trie_regex(terms) -> str:
+    """Render *terms* as a prefix-trie regex, e.g. ``spearhead(?:ed)?``.
+
+    Shared prefixes are matched once, so each position costs a walk down the
+    trie instead of a try per term. Optional tails are greedy, so the longest
+    term wins and shorter ones are reached by backtracking.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+class _TermScanner(NamedTuple):
+    """Compiled scanner for one term list (see _compile_terms)."""
+
+    text_re: re.Pattern[str]
+    bytes_re: re.Pattern[bytes]
+    nested: dict[str, tuple[tuple[str, int], ...]]
+
+
+def _nested_terms(terms, word_boundary: bool = False) -> dict[str, tuple[tuple[str, int], ...]]:
+    """Map each term to the shorter terms inside it and their offsets.
+
+    A scan only reports the longest term at each position (e.g. "eager to"
+    but not "eager"), so these are added back to keep results identical to
+    checking every term on its own.
+    """
+    nested: dict[str, tuple[tuple[str, int], ...]] = {}
+    for term in terms:
+        inner = []
+        for other in terms:
+            if other == term:
+                continue
+            if word_boundary:
+                needle = r"\b" + re.escape(other) + r"\b"
+            else:
+                needle = "(?=" + re.escape(other) + ")"
+            inner.extend((other, m.start()) for m in re.finditer(needle, term))
+        nested[term] = tuple(inner)
+    return nested
+
+
+def _compile_terms(terms, word_boundary: bool = False) -> _TermScanner:
+    """Compile one trie-shaped pattern that finds every term in a single scan.
+
+    The lookahead keeps matches zero-width so overlapping terms are still seen.
+    A bytes twin of the pattern is kept for the (usual) all-ASCII text.
+    """
+    alternation = _trie_regex(terms)
+    if word_boundary:
+        alternation = rf"\b(?:{alternation})\b"
+    source = f"(?=({alternation}))"
+    return _TermScanner(re.compile(source), re.compile(source.encode()), _nested_terms(terms, word_boundary))
+
+
+def _iter_hits(scanner: _TermScanner, text: str, pos: int = 0, endpos: int | None = None):
+    """Yield ``(term, start)`` for every term occurrence inside ``text[pos:endpos]``.
+
+    The bounds are applied by the regex engine, so no substring is copied.
+    """
+    if endpos is None:
+        endpos = len(text)
+    if text.isascii():
+        # Byte matching skips the wide-char paths; \b means the same on ASCII.
+        matches = scanner.bytes_re.finditer(text.encode("ascii"), pos, endpos)
+        hits = ((m.group(1).decode("ascii"), m.start()) for m in matches)
+    else:
+        hits = ((m.group(1), m.start()) for m in scanner.text_re.finditer(text, pos, endpos))
+    for term, start in hits:
+        yield term, start
+        for inner, offset in scanner.nested[term]:
+            yield inner, start + offset
+
+
+def _scan_terms(scanner: _TermScanner, text: str) -> set[str]:
+    """Return every term from *scanner* that occurs in *text*."""
+    return {term for term, _ in _iter_hits(scanner, text)}
+
+
+_BANNED = _compile_terms(BANNED_WORDS, word_boundary=True)
+_LEAKS = _compile_terms(LLM_LEAK_PHRASES)
+# A section heading on a line of its own (optionally one trailing space).
+_SECTION_HEADING_RE = re.compile(r"(?<![^\n])(summary|experience|education|projects)(?= ?\n)")
+# Watchlist entries long enough to check (one/two-char ones like "c#" are too noisy),
+# sorted so reports list them in a stable order.
+_FAB_USABLE: tuple[str, ...] = tuple(sorted(w for w in FABRICATION_WATCHLIST if len(w) > 2))
+_FABRICATIONS = _compile_terms(_FAB_USABLE)
+
+
+def _first_k(terms, found: set[str], k: int) -> list[str]:
+    """Up to *k* members of *found*, in the order they appear in *terms*."""
+    out: list[str] = []
+    if not found:
+        return out
+    for term in terms:
+        if term in found:
+            out.append(term)
+            if len(out) == k:
+                break
+    return out
+
+
+def _find_banned(text_lower: str, limit: int) -> list[str]:
+    """First *limit* banned words present in *text_lower*, in BANNED_WORDS order."""
+    return _first_k(BANNED_WORDS, _scan_terms(_BANNED, text_lower), limit)
+
+
+def _find_leak(text_lower: str) -> str | None:
+    """First LLM self-talk phrase present in *text_lower*, in LLM_LEAK_PHRASES order."""
+    found = _first_k(LLM_LEAK_PHRASES, _scan_terms(_LEAKS, text_lower), 1)
+    return found[0] if found else None
+
+
+class _ProfileChecks(NamedTuple):
+    """Presence checks specialised for one profile (see _profile_checks)."""
+
+    scanner: _TermScanner | None
+    # (lower-cased token, is_error, message), in report order
+    checks: tuple[tuple[str, bool, str], ...]
+
+
+@functools.lru_cache(maxsize=4)
+def _profile_checks(full_name: str, companies: tuple[str, ...], projects: tuple[str, ...],
+                    school: str, email: str, phone: str) -> _ProfileChecks:
+    """Build the preserved-fact checks for one profile, cached across retries.
+
+    Tokens are lower-cased and messages formatted once, so a validation only
+    scans the text and walks the prepared list.
+    """
+    checks: list[tuple[str, bool, str]] = []
+    if full_name:
+        checks.append((full_name.lower(), False, f"Name '{full_name}' missing -- will be injected"))
+    for company in companies:
+        if company:
+            checks.append((company.lower(), True, f"Company '{company}' missing -- cannot remove real experience"))
+    for project in projects:
+        if project:
+            checks.append((project.lower(), False, f"Project '{project}' not found -- may have been renamed"))
+    if school:
+        checks.append((school.lower(), True, f"Education '{school}' missing"))
+    if email:
+        checks.append((email.lower(), False, "Email missing -- will be injected"))
+    if phone:
+        checks.append((phone.lower(), False, "Phone missing -- will be injected"))
+    tokens = sorted({token for token, _, _ in checks})
+    return _ProfileChecks(_compile_terms(tokens) if tokens else None, tuple(checks))
+
+
+def _checks_for(profile: dict) -> _ProfileChecks:
+    """Cached _profile_checks() for a profile dict."""
+    personal = profile.get("personal", {})
+    resume_facts = profile.get("resume_facts", {})
+    return _profile_checks(
+        personal.get("full_name", ""),
+        tuple(resume_facts.get("preserved_companies", [])),
+        tuple(resume_facts.get("preserved_projects", [])),
+        resume_facts.get("preserved_school", ""),
+        personal.get("email", ""),
+        personal.get("phone", ""),
+    )
+
+
+def _find_present(plan: _ProfileChecks, text_lower: str) -> set[str]:
+    """Lower-cased preserved tokens from *plan* that occur in *text_lower*."""
+    return _scan_terms(plan.scanner, text_lower) if plan.scanner else set()
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────
@@ -79,13 +275,18 @@ def _build_skills_set(profile: dict) -> set[str]:
     return allowed
 
 
+# Single-character fixes applied by sanitize_text in one str.translate pass.
+_SANITIZE_TABLE = str.maketrans({
+    "\u2013": "-",                    # en dash -> hyphen
+    "\u201c": '"', "\u201d": '"',     # smart double quotes
+    "\u2018": "'", "\u2019": "'",     # smart single quotes
+})
+
+
 def sanitize_text(text: str) -> str:
     """Auto-fix common LLM output issues instead of rejecting."""
     text = text.replace(" \u2014 ", ", ").replace("\u2014", ", ")   # em dash -> comma
-    text = text.replace("\u2013", "-")    # en dash -> hyphen
-    text = text.replace("\u201c", '"').replace("\u201d", '"')   # smart double quotes
-    text = text.replace("\u2018", "'").replace("\u2019", "'")   # smart single quotes
-    return text.strip()
+    return text.translate(_SANITIZE_TABLE).strip()
 
 
 # ── JSON Field Validation ─────────────────────────────────────────────────
@@ -116,10 +317,9 @@ def validate_json_fields(data: dict, profile: dict) -> dict:
     # Skills: check for fabrication
     if isinstance(data["skills"], dict):
         skills_text = " ".join(str(v) for v in data["skills"].values()).lower()
-        for fake in FABRICATION_WATCHLIST:
-            if len(fake) <= 2:
-                continue
-            if fake in skills_text:
+        fabricated = _scan_terms(_FABRICATIONS, skills_text)
+        for fake in _FAB_USABLE:
+            if fake in fabricated:
                 errors.append(f"Fabricated skill: '{fake}'")
 
     # Experience: preserved companies must be present
@@ -127,12 +327,11 @@ def validate_json_fields(data: dict, profile: dict) -> dict:
     preserved_companies = resume_facts.get("preserved_companies", [])
 
     if isinstance(data["experience"], list):
+        # One scan over all headers (newline-joined so no match spans two)
+        headers_lower = "\n".join(str(e.get("header", "")).lower() for e in data["experience"])
+        present = _find_present(_checks_for(profile), headers_lower)
         for company in preserved_companies:
-            has_company = any(
-                company.lower() in str(e.get("header", "")).lower()
-                for e in data["experience"]
-            )
-            if not has_company:
+            if company and company.lower() not in present:
                 errors.append(f"Company '{company}' missing from experience")
         for entry in data["experience"]:
             for b in entry.get("bullets", []):
@@ -154,13 +353,13 @@ def validate_json_fields(data: dict, profile: dict) -> dict:
     # Bulk checks on all text (word-boundary matching)
     all_text = " ".join(all_text_parts).lower()
 
-    found_banned = [w for w in BANNED_WORDS if re.search(r"\b" + re.escape(w) + r"\b", all_text)]
+    found_banned = _find_banned(all_text, 3)
     if found_banned:
-        errors.append(f"Banned words: {', '.join(found_banned[:3])}")
+        errors.append(f"Banned words: {', '.join(found_banned)}")
 
-    found_leaks = [p for p in LLM_LEAK_PHRASES if p in all_text]
-    if found_leaks:
-        errors.append(f"LLM self-talk: '{found_leaks[0]}'")
+    leak = _find_leak(all_text)
+    if leak:
+        errors.append(f"LLM self-talk: '{leak}'")
 
     return {"passed": len(errors) == 0, "errors": errors, "warnings": warnings}
 
@@ -182,67 +381,44 @@ def validate_tailored_resume(text: str, profile: dict, original_text: str = "")
     warnings: list[str] = []
     text_lower = text.lower()
 
-    personal = profile.get("personal", {})
-    resume_facts = profile.get("resume_facts", {})
-
     # 1. Check required sections exist (flexible matching)
-    section_variants: dict[str, list[str]] = {
-        "SUMMARY": ["summary", "professional summary", "profile"],
-        "TECHNICAL SKILLS": ["technical skills", "skills", "tech stack", "core skills", "technologies"],
-        "EXPERIENCE": ["experience", "work experience", "professional experience"],
-        "PROJECTS": ["projects", "personal projects", "key projects", "selected projects"],
-        "EDUCATION": ["education", "academic background"],
-    }
-    for section, variants in section_variants.items():
+    for section, variants in SECTION_VARIANTS.items():
         if not any(v in text_lower for v in variants):
             errors.append(f"Missing required section: {section} (or variant)")
 
-    # 2. Check name preserved (warn, don't error -- we can inject it)
-    full_name = personal.get("full_name", "")
-    if full_name and full_name.lower() not in text_lower:
-        warnings.append(f"Name '{full_name}' missing -- will be injected")
-
-    # 3. Check companies preserved
-    for company in resume_facts.get("preserved_companies", []):
-        if company.lower() not in text_lower:
-            errors.append(f"Company '{company}' missing -- cannot remove real experience")
-
-    # 4. Check projects preserved
-    for project in resume_facts.get("preserved_projects", []):
-        if project.lower() not in text_lower:
-            warnings.append(f"Project '{project}' not found -- may have been renamed")
-
-    # 5. Check school preserved
-    preserved_school = resume_facts.get("preserved_school", "")
-    if preserved_school and preserved_school.lower() not in text_lower:
-        errors.append(f"Education '{preserved_school}' missing")
-
-    # 6. Check contact info preserved (warn, don't error -- we can inject)
-    email = personal.get("email", "")
-    phone = personal.get("phone", "")
-    if email and email.lower() not in text_lower:
-        warnings.append("Email missing -- will be injected")
-    if phone and phone not in text:
-        warnings.append("Phone missing -- will be injected")
+    # 2-6. Name, companies, projects, school and contact info in one pass
+    # (missing name/contact info only warns -- we can inject it)
+    plan = _checks_for(profile)
+    present = _find_present(plan, text_lower)
+    for token, is_error, message in plan.checks:
+        if token not in present:
+            (errors if is_error else warnings).append(message)
 
-    # 7. Scan TECHNICAL SKILLS section for fabricated tools
+    # 7-8. One watchlist sweep over the whole text serves both checks
     skills_start = text_lower.find("technical skills")
     skills_end = text_lower.find("experience", skills_start) if skills_start != -1 else -1
-    if skills_start != -1 and skills_end != -1:
-        skills_block = text_lower[skills_start:skills_end]
-        for fake in FABRICATION_WATCHLIST:
-            if len(fake) <= 2:
-                continue
-            if fake in skills_block:
+    has_skills_block = skills_start != -1 and skills_end != -1
+    if original_text:
+        hits = list(_iter_hits(_FABRICATIONS, text_lower))
+    elif has_skills_block:
+        hits = list(_iter_hits(_FABRICATIONS, text_lower, skills_start, skills_end))
+    else:
+        hits = []
+
+    # 7. Scan TECHNICAL SKILLS section for fabricated tools
+    if has_skills_block:
+        fabricated = {term for term, start in hits if skills_start <= start and start + len(term) <= skills_end}
+        for fake in _FAB_USABLE:
+            if fake in fabricated:
                 errors.append(f"FABRICATED SKILL in Technical Skills: '{fake}'")
 
     # 8. Scan full document for fabrication watchlist items not in original
     if original_text:
-        original_lower = original_text.lower()
-        for fake in FABRICATION_WATCHLIST:
-            if len(fake) <= 2:
-                continue
-            if fake in text_lower and fake not in original_lower:
+        watchlisted = {term for term, _ in hits}
+        # Only lower-case and scan the original when there is something to compare.
+        original_found = _scan_terms(_FABRICATIONS, original_text.lower()) if watchlisted else set()
+        for fake in _FAB_USABLE:
+            if fake in watchlisted and fake not in original_found:
                 warnings.append(f"New tool/skill appeared: '{fake}' (not in original)")
 
     # 9. Em dashes (should be auto-fixed by sanitize_text, but safety net)
@@ -250,20 +426,19 @@ def validate_tailored_resume(text: str, profile: dict, original_text: str = "")
         errors.append("Contains em dash or en dash.")
 
     # 10. Banned words (word-boundary matching)
-    found_banned = [w for w in BANNED_WORDS if re.search(r"\b" + re.escape(w) + r"\b", text_lower)]
+    found_banned = _find_banned(text_lower, 5)
     if found_banned:
-        errors.append(f"Banned words: {', '.join(found_banned[:5])}")
+        errors.append(f"Banned words: {', '.join(found_banned)}")
 
     # 11. LLM self-talk leak detection
-    found_leaks = [p for p in LLM_LEAK_PHRASES if p in text_lower]
-    if found_leaks:
-        errors.append(f"LLM self-talk: '{found_leaks[0]}'")
+    leak = _find_leak(text_lower)
+    if leak:
+        errors.append(f"LLM self-talk: '{leak}'")
 
     # 12. Duplicate section detection
-    for section_name in ["summary", "experience", "education", "projects"]:
-        count = text_lower.count(f"\n{section_name}\n") + text_lower.count(f"\n{section_name} \n")
-        if text_lower.startswith(f"{section_name}\n"):
-            count += 1
+    heading_counts = Counter(_SECTION_HEADING_RE.findall(text_lower))
+    for section_name in ("summary", "experience", "education", "projects"):
+        count = heading_counts[section_name]
         if count > 1:
             errors.append(f"Section '{section_name}' appears {count} times.")
 
@@ -274,8 +449,86 @@ def validate_tailored_resume(text: str, profile: dict, original_text: str = "")
     }
 
 
+_BATCH_SEQUENTIAL_MAX = 4
+
+
+def validate_tailored_resumes(texts: list[str], profile: dict, original_text: str = "",
+                              workers: int | None = None) -> list[dict]:
+    """Validate several tailored resume candidates against the same profile.
+
+    Small batches run inline; larger ones are spread over worker processes,
+    each of which compiles the profile scanner once and reuses it.
+
+    Args:
+        texts: Tailored resume texts to validate.
+        profile: User profile dict from load_profile().
+        original_text: The original base resume text (for fabrication comparison).
+        workers: Process count for large batches (defaults to the CPU count).
+
+    Returns:
+        One validate_tailored_resume() result per text, in input order.
+    """
+    if len(texts) <= _BATCH_SEQUENTIAL_MAX:
+        return [validate_tailored_resume(t, profile, original_text) for t in texts]
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            validate_tailored_resume,
+            texts,
+            repeat(profile),
+            repeat(original_text),
+            chunksize=max(1, len(texts) // (4 * workers)),
+        ))
+
+
 # ── Cover Letter Validation ──────────────────────────────────────────────
 
+# Banned words, leak phrases and dashes in one pattern; the group that
+# matched tells them apart. ASCII text cannot hold a dash, so its bytes
+# twin leaves that branch out.
+_COVER_MAX_WORDS = 300
+_COVER_TERMS = rf"(\b(?:{_trie_regex(BANNED_WORDS)})\b)|({_trie_regex(LLM_LEAK_PHRASES)})"
+_COVER_RE = re.compile(f"(?={_COVER_TERMS}|([\u2013\u2014]))")
+_COVER_BYTES_RE = re.compile(f"(?={_COVER_TERMS})".encode())
+
+
+def _scan_cover_letter(text_lower: str) -> tuple[bool, set[str], set[str]]:
+    """Single sweep for validate_cover_letter: (has dash, banned words, leak phrases)."""
+    has_dash = False
+    banned: set[str] = set()
+    leaks: set[str] = set()
+    if text_lower.isascii():
+        data = text_lower.encode("ascii")
+        matches = _COVER_BYTES_RE.finditer(data)
+        leak_re = _LEAKS.bytes_re
+    else:
+        data = text_lower
+        matches = _COVER_RE.finditer(data)
+        leak_re = _LEAKS.text_re
+    for m in matches:
+        group = m.lastindex
+        if group == 3:
+            has_dash = True
+            continue
+        term = m.group(group)
+        if isinstance(term, bytes):
+            term = term.decode("ascii")
+        if group == 1:
+            banned.add(term)
+            banned.update(inner for inner, _ in _BANNED.nested[term])
+            # Banned words win ties, so check for a leak starting here too.
+            leak = leak_re.match(data, m.start())
+            if leak is None:
+                continue
+            term = leak.group(1)
+            if isinstance(term, bytes):
+                term = term.decode("ascii")
+        leaks.add(term)
+        leaks.update(inner for inner, _ in _LEAKS.nested[term])
+    return has_dash, banned, leaks
+
+
 def validate_cover_letter(text: str) -> dict:
     """Programmatic validation of a cover letter.
 
@@ -287,29 +540,31 @@ def validate_cover_letter(text: str) -> dict:
     """
     errors: list[str] = []
     text_lower = text.lower()
+    has_dash, banned, leaks = _scan_cover_letter(text_lower)
 
     # 1. Em dashes
-    if "\u2014" in text or "\u2013" in text:
+    if has_dash:
         errors.append("Contains em dash or en dash.")
 
     # 2. Banned words (word-boundary matching)
-    found = [w for w in BANNED_WORDS if re.search(r"\b" + re.escape(w) + r"\b", text_lower)]
+    found = _first_k(BANNED_WORDS, banned, 5)
     if found:
-        errors.append(f"Banned words: {', '.join(found[:5])}")
+        errors.append(f"Banned words: {', '.join(found)}")
 
-    # 3. Too long
-    words = len(text.split())
-    if words > 300:
-        errors.append(f"Too long ({words} words). Max 250.")
+    # 3. Too long (301 words need at least 601 characters, so shorter
+    # letters skip building the word list altogether)
+    if len(text) > _COVER_MAX_WORDS * 2:
+        words = len(text.split())
+        if words > _COVER_MAX_WORDS:
+            errors.append(f"Too long ({words} words). Max 250.")
 
     # 4. LLM self-talk
-    found_leaks = [p for p in LLM_LEAK_PHRASES if p in text_lower]
+    found_leaks = _first_k(LLM_LEAK_PHRASES, leaks, 1)
     if found_leaks:
         errors.append(f"LLM self-talk: '{found_leaks[0]}'")
 
     # 5. Must start with "Dear"
-    stripped = text.strip()
-    if not stripped.lower().startswith("dear"):
+    if not text_lower.lstrip().startswith("dear"):
         errors.append("Must start with 'Dear Hiring Manager,'")
 
     return {"passed": len(errors) == 0, "errors": errors}
@@ -10,15 +10,24 @@ Generates a self-contained HTML dashboard with:
 
 from __future__ import annotations
 
+import json
 import os
+import queue
+import sqlite3
+import threading
 import webbrowser
+from collections.abc import Iterable, Iterator
+from contextlib import closing, nullcontext
+from functools import lru_cache
 from html import escape
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from rich.console import Console
 
-from applypilot.config import APP_DIR, DB_PATH, DEFAULTS, SCORE_FILTERS, load_site_colors
-from applypilot.database import get_connection
+from applypilot.config import APP_DIR, CONFIG_DIR, DB_PATH, DEFAULTS, SCORE_FILTERS, load_site_colors
+from applypilot.database import get_read_only_connection
 
 console = Console()
 HIGH_SCORE_MIN = int(SCORE_FILTERS.get("high", {}).get("min_score", DEFAULTS["min_score"]))
@@ -26,298 +35,148 @@ MID_SCORE_MIN = int(SCORE_FILTERS.get("mid", {}).get("min_score", 5))
 MID_SCORE_MAX = int(SCORE_FILTERS.get("mid", {}).get("max_score", HIGH_SCORE_MIN - 1))
 LOW_SCORE_MAX = int(SCORE_FILTERS.get("low", {}).get("max_score", MID_SCORE_MIN - 1))
 
-
-def generate_dashboard(output_path: str | None = None) -> str:
-    """Generate an HTML dashboard of all jobs with fit scores.
-
-    Args:
-        output_path: Where to write the HTML file. Defaults to ~/.applypilot/dashboard.html.
-
-    Returns:
-        Absolute path to the generated HTML file.
-    """
-    out = Path(output_path) if output_path else APP_DIR / "dashboard.html"
-
-    conn = get_connection()
-
-    # Stats
-    total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
-    ready = conn.execute(
-        "SELECT COUNT(*) FROM jobs "
-        "WHERE full_description IS NOT NULL AND application_url IS NOT NULL"
-    ).fetchone()[0]
-    scored = conn.execute(
-        "SELECT COUNT(*) FROM jobs WHERE fit_score IS NOT NULL"
-    ).fetchone()[0]
-    high_fit = conn.execute(
-        "SELECT COUNT(*) FROM jobs WHERE fit_score >= ?",
-        (HIGH_SCORE_MIN,),
-    ).fetchone()[0]
-
-    # Score distribution
-    score_dist: dict[int, int] = {}
-    if scored:
-        rows = conn.execute(
-            "SELECT fit_score, COUNT(*) FROM jobs "
-            "WHERE fit_score IS NOT NULL "
-            "GROUP BY fit_score ORDER BY fit_score DESC"
-        ).fetchall()
-        for r in rows:
-            score_dist[r[0]] = r[1]
-
-    # Site stats
-    site_stats = conn.execute("""
-        SELECT site,
-               COUNT(*) as total,
-               SUM(CASE WHEN fit_score >= ? THEN 1 ELSE 0 END) as high_fit,
-               SUM(CASE WHEN fit_score BETWEEN ? AND ? THEN 1 ELSE 0 END) as mid_fit,
-               SUM(CASE WHEN fit_score <= ? AND fit_score IS NOT NULL THEN 1 ELSE 0 END) as low_fit,
-               SUM(CASE WHEN fit_score IS NULL THEN 1 ELSE 0 END) as unscored,
-               ROUND(AVG(fit_score), 1) as avg_score
-        FROM jobs GROUP BY site ORDER BY high_fit DESC, total DESC
-    """, (HIGH_SCORE_MIN, MID_SCORE_MIN, MID_SCORE_MAX, LOW_SCORE_MAX)).fetchall()
-
-    # All scored jobs (5+), ordered by score desc
-    jobs = conn.execute("""
-        SELECT url, title, salary, description, location, site, strategy,
-               full_description, application_url, detail_error,
-               fit_score, score_reasoning
-        FROM jobs
-        WHERE fit_score >= ?
-        ORDER BY fit_score DESC, site, title
-    """, (MID_SCORE_MIN,)).fetchall()
-
-    # Site colors come from sites.yaml, unknown sites fall back to neutral.
-    colors = load_site_colors()
-
-    # Score distribution bar chart
-    score_bars = ""
-    max_count = max(score_dist.values()) if score_dist else 1
-    for s in range(10, 0, -1):
-        count = score_dist.get(s, 0)
-        pct = (count / max_count * 100) if max_count else 0
-        score_color = "#10b981" if s >= HIGH_SCORE_MIN else ("#f59e0b" if s >= MID_SCORE_MIN else "#ef4444")
-        score_bars += f"""
-        <div class="score-row">
-          <span class="score-label">{s}</span>
-          <div class="score-bar-track">
-            <div class="score-bar-fill" style="width:{pct}%;background:{score_color}"></div>
-          </div>
-          <span class="score-count">{count}</span>
-        </div>"""
-
-    # Site stats rows
-    site_rows = ""
-    for s in site_stats:
-        site = s["site"] or "?"
-        color = colors.get(site, "#6b7280")
-        avg = s["avg_score"] or 0
-        site_rows += f"""
-        <div class="site-row">
-          <div class="site-name" style="color:{color}">{escape(site)}</div>
-          <div class="site-nums">{s['total']} jobs &middot; {s['high_fit']} strong fit &middot; avg score {avg}</div>
-          <div class="bar-track">
-            <div class="bar-fill" style="width:{s['high_fit']/max(s['total'],1)*100}%;background:{color}"></div>
-            <div class="bar-fill" style="width:{s['mid_fit']/max(s['total'],1)*100}%;background:{color}66"></div>
-          </div>
-        </div>"""
-
-    # Job cards grouped by score
-    job_sections = ""
-    current_score = None
-    for j in jobs:
-        score = j["fit_score"] or 0
-        if score != current_score:
-            if current_score is not None:
-                job_sections += "</div>"
-            score_color = "#10b981" if score >= HIGH_SCORE_MIN else "#f59e0b"
-            score_label = {
-                10: "Perfect Match", 9: "Excellent Fit", 8: "Strong Fit",
-                7: "Good Fit", 6: "Moderate+", 5: "Moderate",
-            }.get(score, f"Score {score}")
-            count_at_score = score_dist.get(score, 0)
-            job_sections += f"""
-            <h2 class="score-header" style="border-color:{score_color}">
-              <span class="score-badge" style="background:{score_color}">{score}</span>
-              {score_label} ({count_at_score} jobs)
-            </h2>
-            <div class="job-grid">"""
-            current_score = score
-
-        title = escape(j["title"] or "Untitled")
-        url = escape(j["url"] or "")
-        salary = escape(j["salary"] or "")
-        location = escape(j["location"] or "")
-        site = escape(j["site"] or "")
-        site_color = colors.get(j["site"] or "", "#6b7280")
-        apply_url = escape(j["application_url"] or "")
-
-        # Parse keywords and reasoning from score_reasoning
-        reasoning_raw = j["score_reasoning"] or ""
-        reasoning_lines = reasoning_raw.split("\n")
-        keywords = reasoning_lines[0][:120] if reasoning_lines else ""
-        reasoning = reasoning_lines[1][:200] if len(reasoning_lines) > 1 else ""
-
-        desc_preview = escape(j["full_description"] or "")[:300]
-        full_desc_html = escape(j["full_description"] or "").replace("\n", "<br>")
-        desc_len = len(j["full_description"] or "")
-
-        meta_parts = []
-        meta_parts.append(
-            f'<span class="meta-tag site-tag" style="background:{site_color}33;color:{site_color}">{site}</span>'
-        )
-        if salary:
-            meta_parts.append(f'<span class="meta-tag salary">{salary}</span>')
-        if location:
-            meta_parts.append(f'<span class="meta-tag location">{location[:40]}</span>')
-        meta_html = " ".join(meta_parts)
-
-        apply_html = ""
-        if apply_url:
-            apply_html = f'<a href="{apply_url}" class="apply-link" target="_blank">Apply</a>'
-
-        job_sections += f"""
-        <div class="job-card" data-score="{score}" data-site="{escape(j['site'] or '')}" data-location="{location.lower()}">
-          <div class="card-header">
-            <span class="score-pill" style="background:{'#10b981' if score >= HIGH_SCORE_MIN else '#f59e0b'}">{score}</span>
-            <a href="{url}" class="job-title" target="_blank">{title}</a>
-          </div>
-          <div class="meta-row">{meta_html}</div>
-          {f'<div class="keywords-row">{escape(keywords)}</div>' if keywords else ''}
-          {f'<div class="reasoning-row">{escape(reasoning)}</div>' if reasoning else ''}
-          <p class="desc-preview">{desc_preview}...</p>
-          {"<details class='full-desc-details'><summary class='expand-btn'>Full Description (" + f'{desc_len:,}' + " chars)</summary><div class='full-desc'>" + full_desc_html + "</div></details>" if j["full_description"] else ""}
-          <div class="card-footer">{apply_html}</div>
-        </div>"""
-
-    if current_score is not None:
-        job_sections += "</div>"
-
-    excellent_threshold = min(10, HIGH_SCORE_MIN + 1)
-    perfect_threshold = min(10, HIGH_SCORE_MIN + 2)
-
-    html = f"""<!DOCTYPE html>
+# Per-score lookups, indexed by fit_score (the scorer clamps it to 1-10).
+# The tier picks the .bg-*/.border-* classes that color pills, badges and bars.
+_SCORE_TIERS = tuple(
+    "high" if s >= HIGH_SCORE_MIN else ("mid" if s >= MID_SCORE_MIN else "low")
+    for s in range(11)
+)
+_SCORE_LABELS = {
+    10: "Perfect Match", 9: "Excellent Fit", 8: "Strong Fit",
+    7: "Good Fit", 6: "Moderate+", 5: "Moderate",
+}
+_LABEL_BY_SCORE = tuple(_SCORE_LABELS.get(s, f"Score {s}") for s in range(11))
+
+_EXCELLENT_THRESHOLD = min(10, HIGH_SCORE_MIN + 1)
+_PERFECT_THRESHOLD = min(10, HIGH_SCORE_MIN + 2)
+
+# Static page chrome, split at the points where the per-run fragments go.
+_PAGE_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
 <title>ApplyPilot Dashboard</title>
 <style>
-  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif; background: #0f172a; color: #e2e8f0; padding: 2rem; }}
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif; background: #0f172a; color: #e2e8f0; padding: 2rem; }
 
-  h1 {{ font-size: 1.8rem; font-weight: 700; margin-bottom: 0.5rem; }}
-  .subtitle {{ color: #94a3b8; margin-bottom: 2rem; }}
+  h1 { font-size: 1.8rem; font-weight: 700; margin-bottom: 0.5rem; }
+  .subtitle { color: #94a3b8; margin-bottom: 2rem; }
 
   /* Summary cards */
-  .summary {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; margin-bottom: 2.5rem; }}
-  .stat-card {{ background: #1e293b; border-radius: 12px; padding: 1.25rem; }}
-  .stat-num {{ font-size: 2rem; font-weight: 700; }}
-  .stat-label {{ color: #94a3b8; font-size: 0.85rem; margin-top: 0.25rem; }}
-  .stat-ok .stat-num {{ color: #10b981; }}
-  .stat-scored .stat-num {{ color: #60a5fa; }}
-  .stat-high .stat-num {{ color: #f59e0b; }}
-  .stat-total .stat-num {{ color: #e2e8f0; }}
+  .summary { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; margin-bottom: 2.5rem; }
+  .stat-card { background: #1e293b; border-radius: 12px; padding: 1.25rem; }
+  .stat-num { font-size: 2rem; font-weight: 700; }
+  .stat-label { color: #94a3b8; font-size: 0.85rem; margin-top: 0.25rem; }
+  .stat-ok .stat-num { color: #10b981; }
+  .stat-scored .stat-num { color: #60a5fa; }
+  .stat-high .stat-num { color: #f59e0b; }
+  .stat-total .stat-num { color: #e2e8f0; }
 
   /* Filters */
-  .filters {{ background: #1e293b; border-radius: 12px; padding: 1.25rem; margin-bottom: 2rem; display: flex; gap: 1rem; flex-wrap: wrap; align-items: center; }}
-  .filter-label {{ color: #94a3b8; font-size: 0.85rem; font-weight: 600; }}
-  .filter-btn {{ background: #334155; border: none; color: #94a3b8; padding: 0.4rem 0.8rem; border-radius: 6px; cursor: pointer; font-size: 0.8rem; transition: all 0.15s; }}
-  .filter-btn:hover {{ background: #475569; color: #e2e8f0; }}
-  .filter-btn.active {{ background: #60a5fa; color: #0f172a; font-weight: 600; }}
-  .search-input {{ background: #334155; border: 1px solid #475569; color: #e2e8f0; padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.8rem; width: 200px; }}
-  .search-input::placeholder {{ color: #64748b; }}
+  .filters { background: #1e293b; border-radius: 12px; padding: 1.25rem; margin-bottom: 2rem; display: flex; gap: 1rem; flex-wrap: wrap; align-items: center; }
+  .filter-label { color: #94a3b8; font-size: 0.85rem; font-weight: 600; }
+  .filter-btn { background: #334155; border: none; color: #94a3b8; padding: 0.4rem 0.8rem; border-radius: 6px; cursor: pointer; font-size: 0.8rem; transition: all 0.15s; }
+  .filter-btn:hover { background: #475569; color: #e2e8f0; }
+  .filter-btn.active { background: #60a5fa; color: #0f172a; font-weight: 600; }
+  .search-input { background: #334155; border: 1px solid #475569; color: #e2e8f0; padding: 0.4rem 0.8rem; border-radius: 6px; font-size: 0.8rem; width: 200px; }
+  .search-input::placeholder { color: #64748b; }
 
   /* Score distribution */
-  .score-section {{ display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem; margin-bottom: 2.5rem; }}
-  .score-dist {{ background: #1e293b; border-radius: 12px; padding: 1.5rem; }}
-  .score-dist h3 {{ font-size: 1rem; margin-bottom: 1rem; color: #94a3b8; }}
-  .score-row {{ display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.4rem; }}
-  .score-label {{ width: 1.5rem; text-align: right; font-size: 0.85rem; font-weight: 600; }}
-  .score-bar-track {{ flex: 1; height: 14px; background: #334155; border-radius: 4px; overflow: hidden; }}
-  .score-bar-fill {{ height: 100%; border-radius: 4px; transition: width 0.3s; }}
-  .score-count {{ width: 2.5rem; font-size: 0.8rem; color: #94a3b8; }}
+  .score-section { display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem; margin-bottom: 2.5rem; }
+  .score-dist { background: #1e293b; border-radius: 12px; padding: 1.5rem; }
+  .score-dist h3 { font-size: 1rem; margin-bottom: 1rem; color: #94a3b8; }
+  .score-row { display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.4rem; }
+  .score-label { width: 1.5rem; text-align: right; font-size: 0.85rem; font-weight: 600; }
+  .score-bar-track { flex: 1; height: 14px; background: #334155; border-radius: 4px; overflow: hidden; }
+  .score-bar-fill { height: 100%; border-radius: 4px; transition: width 0.3s; }
+  .score-count { width: 2.5rem; font-size: 0.8rem; color: #94a3b8; }
 
   /* Site bars */
-  .sites-section {{ background: #1e293b; border-radius: 12px; padding: 1.5rem; }}
-  .sites-section h3 {{ font-size: 1rem; margin-bottom: 1rem; color: #94a3b8; }}
-  .site-row {{ margin-bottom: 0.8rem; }}
-  .site-name {{ font-weight: 600; font-size: 0.9rem; }}
-  .site-nums {{ color: #94a3b8; font-size: 0.75rem; margin: 0.15rem 0; }}
-  .bar-track {{ height: 8px; background: #334155; border-radius: 4px; display: flex; overflow: hidden; }}
-  .bar-fill {{ height: 100%; transition: width 0.3s; }}
+  .sites-section { background: #1e293b; border-radius: 12px; padding: 1.5rem; }
+  .sites-section h3 { font-size: 1rem; margin-bottom: 1rem; color: #94a3b8; }
+  .site-row { margin-bottom: 0.8rem; }
+  .site-name { font-weight: 600; font-size: 0.9rem; }
+  .site-nums { color: #94a3b8; font-size: 0.75rem; margin: 0.15rem 0; }
+  .bar-track { height: 8px; background: #334155; border-radius: 4px; display: flex; overflow: hidden; }
+  .bar-fill { height: 100%; transition: width 0.3s; }
 
   /* Score group headers */
-  .score-header {{ font-size: 1.2rem; font-weight: 600; margin: 2.5rem 0 1rem; padding-bottom: 0.5rem; border-bottom: 3px solid; display: flex; align-items: center; gap: 0.75rem; }}
-  .score-badge {{ display: inline-flex; align-items: center; justify-content: center; width: 2rem; height: 2rem; border-radius: 8px; color: #0f172a; font-weight: 700; font-size: 1rem; }}
+  .score-header { font-size: 1.2rem; font-weight: 600; margin: 2.5rem 0 1rem; padding-bottom: 0.5rem; border-bottom: 3px solid; display: flex; align-items: center; gap: 0.75rem; }
+  .score-badge { display: inline-flex; align-items: center; justify-content: center; width: 2rem; height: 2rem; border-radius: 8px; color: #0f172a; font-weight: 700; font-size: 1rem; }
 
   /* Job grid */
-  .job-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(380px, 1fr)); gap: 1rem; }}
+  .job-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(380px, 1fr)); gap: 1rem; }
 
-  .job-card {{ background: #1e293b; border-radius: 10px; padding: 1rem; border-left: 3px solid #334155; transition: all 0.15s; }}
-  .job-card:hover {{ transform: translateY(-2px); box-shadow: 0 4px 12px #00000044; }}
-  .job-card[data-score="9"], .job-card[data-score="10"] {{ border-left-color: #10b981; }}
-  .job-card[data-score="8"] {{ border-left-color: #34d399; }}
-  .job-card[data-score="7"] {{ border-left-color: #60a5fa; }}
-  .job-card[data-score="6"] {{ border-left-color: #f59e0b; }}
-  .job-card[data-score="5"] {{ border-left-color: #f59e0b88; }}
+  .job-card { background: #1e293b; border-radius: 10px; padding: 1rem; border-left: 3px solid #334155; transition: all 0.15s; }
+  .job-card:hover { transform: translateY(-2px); box-shadow: 0 4px 12px #00000044; }
+  .job-card[data-score="9"], .job-card[data-score="10"] { border-left-color: #10b981; }
+  .job-card[data-score="8"] { border-left-color: #34d399; }
+  .job-card[data-score="7"] { border-left-color: #60a5fa; }
+  .job-card[data-score="6"] { border-left-color: #f59e0b; }
+  .job-card[data-score="5"] { border-left-color: #f59e0b88; }
 
-  .card-header {{ display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem; }}
-  .score-pill {{ display: inline-flex; align-items: center; justify-content: center; min-width: 1.6rem; height: 1.6rem; border-radius: 6px; color: #0f172a; font-weight: 700; font-size: 0.8rem; flex-shrink: 0; }}
+  .card-header { display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem; }
+  .score-pill { display: inline-flex; align-items: center; justify-content: center; min-width: 1.6rem; height: 1.6rem; border-radius: 6px; color: #0f172a; font-weight: 700; font-size: 0.8rem; flex-shrink: 0; }
 
-  .job-title {{ color: #e2e8f0; text-decoration: none; font-weight: 600; font-size: 0.95rem; }}
-  .job-title:hover {{ color: #60a5fa; }}
+  .job-title { color: #e2e8f0; text-decoration: none; font-weight: 600; font-size: 0.95rem; }
+  .job-title:hover { color: #60a5fa; }
 
-  .meta-row {{ display: flex; flex-wrap: wrap; gap: 0.4rem; margin-bottom: 0.4rem; }}
-  .meta-tag {{ font-size: 0.72rem; padding: 0.15rem 0.5rem; border-radius: 4px; background: #334155; color: #94a3b8; }}
-  .meta-tag.salary {{ background: #064e3b; color: #6ee7b7; }}
-  .meta-tag.location {{ background: #1e3a5f; color: #93c5fd; }}
+  .meta-row { display: flex; flex-wrap: wrap; gap: 0.4rem; margin-bottom: 0.4rem; }
+  .meta-tag { font-size: 0.72rem; padding: 0.15rem 0.5rem; border-radius: 4px; background: #334155; color: #94a3b8; }
+  .meta-tag.salary { background: #064e3b; color: #6ee7b7; }
+  .meta-tag.location { background: #1e3a5f; color: #93c5fd; }
 
-  .keywords-row {{ font-size: 0.75rem; color: #10b981; margin-bottom: 0.3rem; line-height: 1.4; }}
-  .reasoning-row {{ font-size: 0.75rem; color: #94a3b8; margin-bottom: 0.5rem; font-style: italic; line-height: 1.4; }}
+  .keywords-row { font-size: 0.75rem; color: #10b981; margin-bottom: 0.3rem; line-height: 1.4; }
+  .reasoning-row { font-size: 0.75rem; color: #94a3b8; margin-bottom: 0.5rem; font-style: italic; line-height: 1.4; }
 
-  .desc-preview {{ font-size: 0.8rem; color: #64748b; line-height: 1.5; margin-bottom: 0.75rem; max-height: 3.6em; overflow: hidden; }}
+  .desc-preview { font-size: 0.8rem; color: #64748b; line-height: 1.5; margin-bottom: 0.75rem; max-height: 3.6em; overflow: hidden; }
 
-  .card-footer {{ display: flex; justify-content: flex-end; }}
-  .apply-link {{ font-size: 0.8rem; color: #60a5fa; text-decoration: none; padding: 0.3rem 0.8rem; border: 1px solid #60a5fa33; border-radius: 6px; font-weight: 500; }}
-  .apply-link:hover {{ background: #60a5fa22; }}
+  .card-footer { display: flex; justify-content: flex-end; }
+  .apply-link { font-size: 0.8rem; color: #60a5fa; text-decoration: none; padding: 0.3rem 0.8rem; border: 1px solid #60a5fa33; border-radius: 6px; font-weight: 500; }
+  .apply-link:hover { background: #60a5fa22; }
 
   /* Expandable full description */
-  .full-desc-details {{ margin-bottom: 0.75rem; }}
-  .expand-btn {{ font-size: 0.8rem; color: #60a5fa; cursor: pointer; list-style: none; padding: 0.3rem 0; }}
-  .expand-btn::-webkit-details-marker {{ display: none; }}
-  .expand-btn:hover {{ color: #93c5fd; }}
-  .full-desc {{ font-size: 0.8rem; color: #cbd5e1; line-height: 1.6; margin-top: 0.5rem; padding: 0.75rem; background: #0f172a; border-radius: 8px; max-height: 400px; overflow-y: auto; white-space: pre-wrap; word-break: break-word; }}
-
-  .hidden {{ display: none !important; }}
-  .job-count {{ color: #94a3b8; font-size: 0.85rem; margin-bottom: 1rem; }}
-
-  @media (max-width: 768px) {{
-    .summary {{ grid-template-columns: repeat(2, 1fr); }}
-    .score-section {{ grid-template-columns: 1fr; }}
-    .job-grid {{ grid-template-columns: 1fr; }}
-    body {{ padding: 1rem; }}
-  }}
-</style>
+  .full-desc-details { margin-bottom: 0.75rem; }
+  .expand-btn { font-size: 0.8rem; color: #60a5fa; cursor: pointer; list-style: none; padding: 0.3rem 0; }
+  .expand-btn::-webkit-details-marker { display: none; }
+  .expand-btn:hover { color: #93c5fd; }
+  .full-desc { font-size: 0.8rem; color: #cbd5e1; line-height: 1.6; margin-top: 0.5rem; padding: 0.75rem; background: #0f172a; border-radius: 8px; max-height: 400px; overflow-y: auto; white-space: pre-wrap; word-break: break-word; }
+
+  /* Score tiers */
+  .bg-high { background: #10b981; }
+  .bg-mid { background: #f59e0b; }
+  .bg-low { background: #ef4444; }
+  .border-high { border-color: #10b981; }
+  .border-mid { border-color: #f59e0b; }
+
+  .hidden { display: none !important; }
+  .job-count { color: #94a3b8; font-size: 0.85rem; margin-bottom: 1rem; }
+
+  @media (max-width: 768px) {
+    .summary { grid-template-columns: repeat(2, 1fr); }
+    .score-section { grid-template-columns: 1fr; }
+    .job-grid { grid-template-columns: 1fr; }
+    body { padding: 1rem; }
+  }
+
+  /* Site tags */
+"""
+
+_PAGE_BODY = """</style>
 </head>
 <body>
 
 <h1>ApplyPilot Dashboard</h1>
-<p class="subtitle">{total} jobs &middot; {scored} scored &middot; {high_fit} strong matches ({HIGH_SCORE_MIN}+)</p>
-
-<div class="summary">
-  <div class="stat-card stat-total"><div class="stat-num">{total}</div><div class="stat-label">Total Jobs</div></div>
-  <div class="stat-card stat-ok"><div class="stat-num">{ready}</div><div class="stat-label">Ready (desc + URL)</div></div>
-  <div class="stat-card stat-scored"><div class="stat-num">{scored}</div><div class="stat-label">Scored by LLM</div></div>
-  <div class="stat-card stat-high"><div class="stat-num">{high_fit}</div><div class="stat-label">Strong Fit ({HIGH_SCORE_MIN}+)</div></div>
-</div>
+"""
 
-<div class="filters">
+_PAGE_FILTERS = f"""<div class="filters">
   <span class="filter-label">Score:</span>
   <button class="filter-btn active" onclick="filterScore(0)">All {MID_SCORE_MIN}+</button>
   <button class="filter-btn" onclick="filterScore({HIGH_SCORE_MIN})">{HIGH_SCORE_MIN}+ Strong</button>
-  <button class="filter-btn" onclick="filterScore({excellent_threshold})">{excellent_threshold}+ Excellent</button>
-  <button class="filter-btn" onclick="filterScore({perfect_threshold})">{perfect_threshold}+ Perfect</button>
+  <button class="filter-btn" onclick="filterScore({_EXCELLENT_THRESHOLD})">{_EXCELLENT_THRESHOLD}+ Excellent</button>
+  <button class="filter-btn" onclick="filterScore({_PERFECT_THRESHOLD})">{_PERFECT_THRESHOLD}+ Perfect</button>
   <span class="filter-label" style="margin-left:1rem">Search:</span>
   <input type="text" class="search-input" placeholder="Filter by title, site..." oninput="filterText(this.value)">
 </div>
@@ -325,17 +184,52 @@ def generate_dashboard(output_path: str | None = None) -> str:
 <div class="score-section">
   <div class="score-dist">
     <h3>Score Distribution</h3>
-    {score_bars}
+    """
+
+_PAGE_SITES = """
   </div>
   <div class="sites-section">
     <h3>By Source</h3>
-    {site_rows}
+    """
+
+_PAGE_JOBS = """
   </div>
 </div>
 
 <div id="job-count" class="job-count"></div>
 
-{job_sections}
+"""
+
+# Score distribution chart: one row per score, highest first. Slots: score,
+# bar tier, bar width (percent of the tallest bar), count.
+_CHART_SCORES = range(10, 0, -1)
+_SCORE_BAR_HTML = """
+        <div class="score-row">
+          <span class="score-label">%s</span>
+          <div class="score-bar-track">
+            <div class="score-bar-fill bg-%s" style="width:%s%%"></div>
+          </div>
+          <span class="score-count">%s</span>
+        </div>"""
+
+# One job card. Positional %s slots, filled in this order: score, site,
+# location (lowercased), score tier, score, url, title, meta tags, keywords,
+# reasoning, description preview, full-description block, apply link.
+_CARD_HTML = """
+        <div class="job-card" data-score="%s" data-site="%s" data-location="%s">
+          <div class="card-header">
+            <span class="score-pill bg-%s">%s</span>
+            <a href="%s" class="job-title" target="_blank">%s</a>
+          </div>
+          <div class="meta-row">%s</div>
+          %s
+          %s
+          <p class="desc-preview">%s...</p>
+          %s
+          <div class="card-footer">%s</div>
+        </div>"""
+
+_PAGE_TAIL = f"""
 
 <script>
 let minScore = 0;
@@ -382,20 +276,323 @@ function applyFilters() {{
   }});
 }}
 
+// Full descriptions ship as inert JSON and only become DOM when first opened.
+document.addEventListener('toggle', e => {{
+  const d = e.target;
+  if (!d.open || !d.classList.contains('full-desc-details') || d.dataset.loaded) return;
+  const div = document.createElement('div');
+  div.className = 'full-desc';
+  div.textContent = JSON.parse(d.querySelector('script').textContent);
+  d.appendChild(div);
+  d.dataset.loaded = '1';
+}}, true);
+
 applyFilters();
 </script>
 
 </body>
 </html>"""
 
+
+def _desc_json(s: str) -> str:
+    """JSON-encode a description for an inline data <script>.
+
+    Escaping "<" stops a "</script>" or "<!--" in the text from ending or
+    confusing the script element.
+    """
+    return json.dumps(s, ensure_ascii=False).replace("<", "\\u003c")
+
+
+def _esc(s: str) -> str:
+    """Escape text placed between tags; quotes only matter inside attributes."""
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _prefetch(cursor: sqlite3.Cursor, batch_size: int = 500, depth: int = 4) -> Iterator[tuple]:
+    """Yield the cursor's rows while a helper thread fetches the next batches.
+
+    sqlite3 releases the GIL while stepping a query, so reading the next batch
+    overlaps with rendering the current one. Closing the generator early (e.g.
+    rendering raised) stops the helper and waits for it to let go of the cursor.
+    """
+    batches: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def offer(item: object) -> bool:
+        # A bounded put that gives up once the consumer has gone away.
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def produce() -> None:
+        try:
+            while batch := cursor.fetchmany(batch_size):
+                if not offer(batch):
+                    return
+            offer(None)
+        except BaseException as exc:
+            # Hand every failure to the consumer; a dead helper with nothing
+            # queued would leave it blocked in get() forever.
+            offer(exc)
+
+    producer = threading.Thread(target=produce, name="dashboard-prefetch", daemon=True)
+    producer.start()
+    try:
+        while (batch := batches.get()) is not None:
+            if isinstance(batch, BaseException):
+                raise batch
+            yield from batch
+    finally:
+        stop.set()
+        producer.join()
+
+
+@lru_cache(maxsize=1)
+def _site_colors_at(mtime_ns: int | None) -> dict[str, str]:
+    return load_site_colors()
+
+
+def _site_colors() -> dict[str, str]:
+    """load_site_colors(), re-parsed only when sites.yaml has changed."""
+    try:
+        mtime_ns = (CONFIG_DIR / "sites.yaml").stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _site_colors_at(mtime_ns)
+
+
+def generate_dashboard(output_path: str | None = None) -> str:
+    """Generate an HTML dashboard of all jobs with fit scores.
+
+    Args:
+        output_path: Where to write the HTML file. Defaults to ~/.applypilot/dashboard.html.
+
+    Returns:
+        Absolute path to the generated HTML file.
+    """
+    out = Path(output_path) if output_path else APP_DIR / "dashboard.html"
+
+    # The page goes to a sibling temp file that replaces the old dashboard only
+    # once complete; a failed render leaves neither a partial page nor the temp.
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(html, encoding="utf-8")
+    tmp = out.with_name(out.name + ".tmp")
+    conn = get_read_only_connection()
+    try:
+        _write_dashboard(conn, tmp)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    finally:
+        conn.close()
+    os.replace(tmp, out)
 
     abs_path = str(out.resolve())
     console.print(f"[green]Dashboard written to {abs_path}[/green]")
     return abs_path
 
 
+def _write_dashboard(conn: sqlite3.Connection, tmp: Path) -> None:
+    """Render the dashboard for the jobs in ``conn`` into ``tmp``."""
+    # Stats (one scan; COUNT of a CASE counts only the rows that match)
+    total, ready, scored, high_fit = conn.execute("""
+        SELECT COUNT(*),
+               COUNT(CASE WHEN full_description IS NOT NULL AND application_url IS NOT NULL THEN 1 END),
+               COUNT(fit_score),
+               COUNT(CASE WHEN fit_score >= ? THEN 1 END)
+        FROM jobs
+    """, (HIGH_SCORE_MIN,)).fetchone()
+
+    # Score distribution
+    score_dist: dict[int, int] = {}
+    if scored:
+        score_dist.update(conn.execute(
+            "SELECT fit_score, COUNT(*) FROM jobs "
+            "WHERE fit_score IS NOT NULL "
+            "GROUP BY fit_score ORDER BY fit_score DESC"
+        ))
+
+    # Site stats, with the bar widths worked out by SQLite (a GROUP BY row
+    # always has total >= 1, so the division is safe)
+    site_stats = []
+    if total:
+        site_stats = conn.execute("""
+            SELECT *,
+                   high_fit * 1.0 / total * 100 as high_pct,
+                   mid_fit * 1.0 / total * 100 as mid_pct
+            FROM (
+                SELECT site,
+                       COUNT(*) as total,
+                       SUM(CASE WHEN fit_score >= ? THEN 1 ELSE 0 END) as high_fit,
+                       SUM(CASE WHEN fit_score BETWEEN ? AND ? THEN 1 ELSE 0 END) as mid_fit,
+                       SUM(CASE WHEN fit_score <= ? AND fit_score IS NOT NULL THEN 1 ELSE 0 END) as low_fit,
+                       SUM(CASE WHEN fit_score IS NULL THEN 1 ELSE 0 END) as unscored,
+                       ROUND(AVG(fit_score), 1) as avg_score
+                FROM jobs GROUP BY site
+            )
+            ORDER BY high_fit DESC, total DESC
+        """, (HIGH_SCORE_MIN, MID_SCORE_MIN, MID_SCORE_MAX, LOW_SCORE_MAX)).fetchall()
+
+    # All scored jobs (5+), ordered by score desc. Streamed in batches by
+    # _prefetch, so only a few batches are held at a time; plain tuples are
+    # unpacked in column order rather than looked up by name per field.
+    jobs: Iterable[tuple] = ()
+    if scored:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("""
+            SELECT url, title, salary, location, site, full_description,
+                   application_url, fit_score, score_reasoning
+            FROM jobs
+            WHERE fit_score >= ?
+            ORDER BY fit_score DESC, site, title
+        """, (MID_SCORE_MIN,))
+        jobs = _prefetch(cursor)
+
+    # Site colors come from sites.yaml, unknown sites fall back to neutral.
+    # Each site's tag color becomes one CSS class instead of an inline style
+    # repeated on every card.
+    colors = _site_colors()
+    site_classes: dict[str | None, str] = {}
+    site_rules = []
+    for i, s in enumerate(site_stats):
+        color = colors.get(s["site"] or "", "#6b7280")
+        site_classes[s["site"]] = f"site-{i}"
+        site_rules.append(f"  .site-{i} {{ background: {color}33; color: {color}; }}\n")
+    site_css = "".join(site_rules)
+
+    stats_html = f"""<p class="subtitle">{total} jobs &middot; {scored} scored &middot; {high_fit} strong matches ({HIGH_SCORE_MIN}+)</p>
+
+<div class="summary">
+  <div class="stat-card stat-total"><div class="stat-num">{total}</div><div class="stat-label">Total Jobs</div></div>
+  <div class="stat-card stat-ok"><div class="stat-num">{ready}</div><div class="stat-label">Ready (desc + URL)</div></div>
+  <div class="stat-card stat-scored"><div class="stat-num">{scored}</div><div class="stat-label">Scored by LLM</div></div>
+  <div class="stat-card stat-high"><div class="stat-num">{high_fit}</div><div class="stat-label">Strong Fit ({HIGH_SCORE_MIN}+)</div></div>
+</div>
+
+"""
+
+    # Each fragment is written as soon as it is built. Closing `jobs` on the way
+    # out stops the prefetch thread before the caller closes the connection.
+    with tmp.open("w", encoding="utf-8", buffering=1 << 20) as f, (closing(jobs) if scored else nullcontext()):
+        write = f.write
+        write(_PAGE_HEAD)
+        write(site_css)
+        write(_PAGE_BODY)
+        write(stats_html)
+        write(_PAGE_FILTERS)
+
+        # Score distribution bar chart
+        counts = [score_dist.get(s, 0) for s in _CHART_SCORES]
+        max_count = max(counts) or 1
+        write("".join(
+            _SCORE_BAR_HTML % (s, _SCORE_TIERS[s], count / max_count * 100, count)
+            for s, count in zip(_CHART_SCORES, counts)
+        ))
+
+        write(_PAGE_SITES)
+
+        # Site stats rows
+        for s in site_stats:
+            site = s["site"] or "?"
+            color = colors.get(site, "#6b7280")
+            avg = s["avg_score"] or 0
+            write(f"""
+        <div class="site-row">
+          <div class="site-name" style="color:{color}">{_esc(site)}</div>
+          <div class="site-nums">{s['total']} jobs &middot; {s['high_fit']} strong fit &middot; avg score {avg}</div>
+          <div class="bar-track">
+            <div class="bar-fill" style="width:{s['high_pct']}%;background:{color}"></div>
+            <div class="bar-fill" style="width:{s['mid_pct']}%;background:{color}66"></div>
+          </div>
+        </div>""")
+
+        write(_PAGE_JOBS)
+
+        site_tags: dict[str | None, tuple[str, str]] = {}
+
+        # Job cards grouped by score. Rows arrive ordered by fit_score, so
+        # each run of equal scores is one section; its size is already known
+        # from score_dist.
+        for score, group in groupby(jobs, key=itemgetter(7)):
+            tier = _SCORE_TIERS[score]
+            score_label = _LABEL_BY_SCORE[score]
+            count_at_score = score_dist.get(score, 0)
+            write(f"""
+            <h2 class="score-header border-{tier}">
+              <span class="score-badge bg-{tier}">{score}</span>
+              {score_label} ({count_at_score} jobs)
+            </h2>
+            <div class="job-grid">""")
+
+            for (
+                job_url, job_title, job_salary, job_location, job_site, full_desc,
+                job_apply_url, _, score_reasoning,
+            ) in group:
+                # html.escape only for values that also land in attributes
+                title = _esc(job_title or "Untitled")
+                url = escape(job_url or "")
+                salary = _esc(job_salary or "")
+                location = escape(job_location or "")
+                apply_url = escape(job_apply_url or "")
+
+                # A handful of sites cover every card: escape each one and
+                # build its tag once.
+                site_entry = site_tags.get(job_site)
+                if site_entry is None:
+                    site = escape(job_site or "")
+                    site_entry = site_tags[job_site] = (
+                        site, f'<span class="meta-tag site-tag {site_classes.get(job_site, "")}">{site}</span>',
+                    )
+                site, site_tag = site_entry
+
+                # Parse keywords and reasoning from score_reasoning
+                reasoning_raw = score_reasoning or ""
+                reasoning_lines = reasoning_raw.split("\n")
+                keywords = reasoning_lines[0][:120] if reasoning_lines else ""
+                reasoning = reasoning_lines[1][:200] if len(reasoning_lines) > 1 else ""
+
+                # Every character escapes to at least one, so the first 300 escaped
+                # characters only ever come from the first 300 raw ones.
+                full_desc = full_desc or ""
+                desc_preview = escape(full_desc[:300])[:300]
+                desc_len = len(full_desc)
+
+                meta_parts = [site_tag]
+                if salary:
+                    meta_parts.append(f'<span class="meta-tag salary">{salary}</span>')
+                if location:
+                    meta_parts.append(f'<span class="meta-tag location">{location[:40]}</span>')
+                meta_html = " ".join(meta_parts)
+
+                apply_html = ""
+                if apply_url:
+                    apply_html = f'<a href="{apply_url}" class="apply-link" target="_blank">Apply</a>'
+
+                # Optional blocks are resolved here so the card template is a flat
+                # substitution.
+                keywords_html = f'<div class="keywords-row">{_esc(keywords)}</div>' if keywords else ""
+                reasoning_html = f'<div class="reasoning-row">{_esc(reasoning)}</div>' if reasoning else ""
+                details_html = ""
+                if full_desc:
+                    details_html = (
+                        f"<details class='full-desc-details'><summary class='expand-btn'>Full Description ({desc_len:,} chars)"
+                        f"</summary><script type='application/json'>{_desc_json(full_desc)}</script></details>"
+                    )
+
+                write(_CARD_HTML % (
+                    score, site, location.lower(), tier, score, url, title,
+                    meta_html, keywords_html, reasoning_html, desc_preview, details_html, apply_html,
+                ))
+
+            write("</div>")
+
+        write(_PAGE_TAIL)
+
+
 def open_dashboard(output_path: str | None = None) -> None:
     """Generate the dashboard and open it in the default browser.
 
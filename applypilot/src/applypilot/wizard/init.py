@@ -10,10 +10,11 @@ Interactive flow that creates ~/.applypilot/ with:
 from __future__ import annotations
 
 import json
+import os
+import re
 import shutil
 from pathlib import Path
 
-import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
@@ -26,22 +27,68 @@ from applypilot.config import (
     RESUME_PDF_PATH,
     SEARCH_CONFIG_PATH,
     ensure_dirs,
+    which,
 )
 
 console = Console()
 
+# One comma-separated item, without its surrounding whitespace.
+_LIST_ITEM_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+def _split_list(raw: str) -> list[str]:
+    """Split a comma-separated answer into stripped, non-empty items."""
+    return _LIST_ITEM_RE.findall(raw)
+
 
 # ---------------------------------------------------------------------------
 # Resume
 # ---------------------------------------------------------------------------
 
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file's contents, permission bits and timestamps, like shutil.copy2.
+
+    Uses os.copy_file_range where available (an in-kernel copy, or a reflink
+    on filesystems that support it), finishing with a 1 MiB read/write loop
+    otherwise. Copying a file onto itself is a no-op.
+    """
+    st = src.stat()
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        copied = 0
+        try:
+            while sent := os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                copied += sent
+            # Some filesystems (FUSE, NFS, procfs) report EOF straight away without
+            # copying anything; shutil treats 0 at offset 0 the same way.
+            fallback = copied == 0
+        except (AttributeError, OSError):
+            # Not Linux, an old kernel, or a cross-device copy it refuses.
+            fallback = True
+        if fallback:
+            # Carry on from wherever the fast path stopped.
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    shutil.copymode(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _user_path(raw: str) -> Path:
+    """Turn a pasted path (possibly quoted, possibly ~-relative) into a Path.
+
+    Not resolved: existence and suffix checks don't need symlinks followed,
+    and the copy opens the path as given.
+    """
+    return Path(os.path.expanduser(raw.strip().strip('"').strip("'")))
+
+
 def _setup_resume() -> None:
     """Prompt for resume file and copy into APP_DIR."""
     console.print(Panel("[bold]Step 1: Resume[/bold]\nPoint to your master resume file (.txt or .pdf)."))
 
     while True:
         path_str = Prompt.ask("Resume file path")
-        src = Path(path_str.strip().strip('"').strip("'")).expanduser().resolve()
+        src = _user_path(path_str)
 
         if not src.exists():
             console.print(f"[red]File not found:[/red] {src}")
@@ -53,10 +100,10 @@ def _setup_resume() -> None:
             continue
 
         if suffix == ".txt":
-            shutil.copy2(src, RESUME_PATH)
+            _copy_file(src, RESUME_PATH)
             console.print(f"[green]Copied to {RESUME_PATH}[/green]")
         elif suffix == ".pdf":
-            shutil.copy2(src, RESUME_PDF_PATH)
+            _copy_file(src, RESUME_PDF_PATH)
             console.print(f"[green]Copied to {RESUME_PDF_PATH}[/green]")
 
             # Also ask for a plain-text version for LLM consumption
@@ -65,9 +112,9 @@ def _setup_resume() -> None:
                 default="",
             )
             if txt_path_str.strip():
-                txt_src = Path(txt_path_str.strip().strip('"').strip("'")).expanduser().resolve()
+                txt_src = _user_path(txt_path_str)
                 if txt_src.exists():
-                    shutil.copy2(txt_src, RESUME_PATH)
+                    _copy_file(txt_src, RESUME_PATH)
                     console.print(f"[green]Copied to {RESUME_PATH}[/green]")
                 else:
                     console.print("[yellow]File not found, skipping plain-text copy.[/yellow]")
@@ -130,9 +177,9 @@ def _setup_profile() -> dict:
     frameworks = Prompt.ask("Frameworks & libraries", default="")
     tools = Prompt.ask("Tools & platforms (e.g. Docker, AWS, Git)", default="")
     profile["skills_boundary"] = {
-        "programming_languages": [s.strip() for s in langs.split(",") if s.strip()],
-        "frameworks": [s.strip() for s in frameworks.split(",") if s.strip()],
-        "tools": [s.strip() for s in tools.split(",") if s.strip()],
+        "programming_languages": _split_list(langs),
+        "frameworks": _split_list(frameworks),
+        "tools": _split_list(tools),
     }
 
     # -- Resume Facts (preserved truths for tailoring) --
@@ -143,10 +190,10 @@ def _setup_profile() -> dict:
     school = Prompt.ask("School name(s) to preserve", default="")
     metrics = Prompt.ask("Real metrics to preserve (e.g. '99.9% uptime, 50k users')", default="")
     profile["resume_facts"] = {
-        "preserved_companies": [s.strip() for s in companies.split(",") if s.strip()],
-        "preserved_projects": [s.strip() for s in projects.split(",") if s.strip()],
+        "preserved_companies": _split_list(companies),
+        "preserved_projects": _split_list(projects),
         "preserved_school": school.strip(),
-        "real_metrics": [s.strip() for s in metrics.split(",") if s.strip()],
+        "real_metrics": _split_list(metrics),
     }
 
     # -- EEO Voluntary (defaults) --
@@ -163,7 +210,8 @@ def _setup_profile() -> dict:
     }
 
     # Save
-    PROFILE_PATH.write_text(json.dumps(profile, indent=2, ensure_ascii=False), encoding="utf-8")
+    with PROFILE_PATH.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        json.dump(profile, f, indent=2, ensure_ascii=False)
     console.print(f"\n[green]Profile saved to {PROFILE_PATH}[/green]")
     return profile
 
@@ -172,6 +220,24 @@ def _setup_profile() -> dict:
 # Search config
 # ---------------------------------------------------------------------------
 
+_SEARCHES_YAML = """\
+# ApplyPilot search configuration
+# Edit this file to refine your job search queries.
+
+defaults:
+  location: "{location}"
+  distance: {distance}
+  hours_old: 72
+  results_per_site: 50
+
+locations:
+  - location: "{location}"
+    remote: {remote}
+
+queries:
+{queries}"""
+
+
 def _setup_searches() -> None:
     """Generate a searches.yaml from user input."""
     console.print(Panel("[bold]Step 3: Job Search Config[/bold]\nDefine what you're looking for."))
@@ -186,34 +252,22 @@ def _setup_searches() -> None:
     roles_raw = Prompt.ask(
         "Target job titles (comma-separated, e.g. 'Backend Engineer, Full Stack Developer')"
     )
-    roles = [r.strip() for r in roles_raw.split(",") if r.strip()]
+    roles = _split_list(roles_raw)
 
     if not roles:
         console.print("[yellow]No roles provided. Using a default set.[/yellow]")
         roles = ["Software Engineer"]
 
-    # Build YAML content
-    lines = [
-        "# ApplyPilot search configuration",
-        "# Edit this file to refine your job search queries.",
-        "",
-        "defaults:",
-        f'  location: "{location}"',
-        f"  distance: {distance}",
-        "  hours_old: 72",
-        "  results_per_site: 50",
-        "",
-        "locations:",
-        f'  - location: "{location}"',
-        f"    remote: {str(distance == 0).lower()}",
-        "",
-        "queries:",
-    ]
-    for i, role in enumerate(roles):
-        lines.append(f'  - query: "{role}"')
-        lines.append(f"    tier: {min(i + 1, 3)}")
-
-    SEARCH_CONFIG_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    queries = "".join(f'  - query: "{role}"\n    tier: {min(i + 1, 3)}\n' for i, role in enumerate(roles))
+    SEARCH_CONFIG_PATH.write_text(
+        _SEARCHES_YAML.format(
+            location=location,
+            distance=distance,
+            remote=str(distance == 0).lower(),
+            queries=queries,
+        ),
+        encoding="utf-8",
+    )
     console.print(f"[green]Search config saved to {SEARCH_CONFIG_PATH}[/green]")
 
 
@@ -228,7 +282,7 @@ def _setup_ai_features() -> None:
         "ApplyPilot uses Gemini CLI for scoring, resume tailoring, and cover letters."
     ))
 
-    if shutil.which("gemini"):
+    if which("gemini"):
         console.print("[green]Gemini CLI detected on PATH.[/green]")
         return
 
@@ -256,7 +310,7 @@ def _setup_auto_apply() -> None:
         return
 
     # Check for Claude Code CLI
-    if shutil.which("claude"):
+    if which("claude"):
         console.print("[green]Claude Code CLI detected.[/green]")
     else:
         console.print(
@@ -269,16 +323,16 @@ def _setup_auto_apply() -> None:
     console.print("\n[dim]Some job sites use CAPTCHAs. CapSolver can handle them automatically.[/dim]")
     if Confirm.ask("Configure CapSolver API key? (optional)", default=False):
         capsolver_key = Prompt.ask("CapSolver API key")
-        # Append to existing .env or create
-        if ENV_PATH.exists():
-            existing = ENV_PATH.read_text(encoding="utf-8")
+        # Append to existing .env or create it (owner-only, it holds secrets)
+        fd = os.open(ENV_PATH, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+        with os.fdopen(fd, "r+", encoding="utf-8") as f:
+            existing = f.read()
             if "CAPSOLVER_API_KEY" not in existing:
-                ENV_PATH.write_text(
-                    existing.rstrip() + f"\nCAPSOLVER_API_KEY={capsolver_key}\n",
-                    encoding="utf-8",
-                )
-        else:
-            ENV_PATH.write_text(f"# ApplyPilot configuration\nCAPSOLVER_API_KEY={capsolver_key}\n", encoding="utf-8")
+                if not existing:
+                    f.write("# ApplyPilot configuration\n")
+                elif not existing.endswith("\n"):
+                    f.write("\n")
+                f.write(f"CAPSOLVER_API_KEY={capsolver_key}\n")
         console.print("[green]CapSolver key saved.[/green]")
     else:
         console.print("[dim]Skipped. Add CAPSOLVER_API_KEY to .env later if needed.[/dim]")
@@ -1,11 +1,15 @@
 """ApplyPilot Web UI Server - FastAPI backend bridging the frontend to ApplyPilot's database and CLI."""
 
 import csv
+import hashlib
 import datetime as dt
 import io
 import json
 import os
 import ast
+import asyncio
+import codecs
+import queue
 import re
 import select
 import shlex
@@ -13,22 +17,31 @@ import shutil
 import sqlite3
 import subprocess
 import sys
+import tempfile
 import threading
-from urllib.parse import parse_qs
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from urllib.parse import parse_qs, quote
 from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import yaml
 from fastapi import FastAPI, File, Query, UploadFile
 from fastapi import HTTPException
 from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 try:
     from applypilot.config import (
+        CONFIG_DIR as APPLYPILOT_CONFIG_DIR,
         DEFAULTS as APPLYPILOT_DEFAULTS,
         ENV_PATH as APPLYPILOT_ENV_PATH,
         SCORE_FILTERS as APPLYPILOT_SCORE_FILTERS,
@@ -36,9 +49,11 @@ try:
         load_blocked_sites,
         load_blocked_sso,
         load_sites_config,
+        yaml_safe_load,
     )
 except ModuleNotFoundError:
     from applypilot.src.applypilot.config import (
+        CONFIG_DIR as APPLYPILOT_CONFIG_DIR,
         DEFAULTS as APPLYPILOT_DEFAULTS,
         ENV_PATH as APPLYPILOT_ENV_PATH,
         SCORE_FILTERS as APPLYPILOT_SCORE_FILTERS,
@@ -46,6 +61,7 @@ except ModuleNotFoundError:
         load_blocked_sites,
         load_blocked_sso,
         load_sites_config,
+        yaml_safe_load,
     )
 
 app = FastAPI(title="ApplyPilot UI")
@@ -62,10 +78,14 @@ APPLYPILOT_BIN = Path(__file__).parent / "applypilot" / ".venv" / "bin" / "apply
 JOBSPY_PATH = Path(__file__).parent / "applypilot" / "src" / "applypilot" / "discovery" / "jobspy.py"
 PIPELINE_PATH = Path(__file__).parent / "applypilot" / "src" / "applypilot" / "pipeline.py"
 LOGS_DIR = CONFIG_DIR / "logs"
+# When set (e.g. "/protected-pdfs/"), PDFs are handed to nginx via X-Accel-Redirect under this
+# internal location, which must alias CONFIG_DIR, instead of being streamed through Python.
+PDF_XACCEL_PREFIX = os.environ.get("APPLYPILOT_PDF_XACCEL_PREFIX", "")
 
 # Track running pipeline processes
 _pipeline_proc = None
 _pipeline_log_lock = threading.Lock()
+PIPELINE_OUTPUT_MAX_LINES = 50000
 _pipeline_meta = {
     "stages": None,
     "resolved_stages": None,
@@ -76,11 +96,16 @@ _pipeline_meta = {
     "started_at": None,
     "finished_at": None,
     "returncode": None,
-    "output": "",
-    "output_lines": [],
+    "output_lines": deque(maxlen=PIPELINE_OUTPUT_MAX_LINES),
+    "output_dropped": 0,
     "output_captured": False,
 }
 DEFAULT_MIN_SCORE = int(APPLYPILOT_DEFAULTS.get("min_score", 7))
+STATS_CACHE_TTL = 2.0
+
+# Last /api/stats payload, reused while the database files are unchanged
+_stats_cache_lock = threading.Lock()
+_stats_cache: dict = {"key": None, "ts": 0.0, "value": None}
 
 
 def _load_env():
@@ -97,12 +122,89 @@ def _load_env():
     return env
 
 
-def get_db():
-    conn = sqlite3.connect(str(DB_PATH))
+_DB_POOL_SIZE = 8
+_db_pool: "queue.Queue[tuple[str, int, sqlite3.Connection]]" = queue.Queue(maxsize=_DB_POOL_SIZE)
+# Bumped by _close_db_pool(); connections from an older generation are closed instead of pooled.
+_db_pool_generation = 0
+
+
+def _open_db(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
 
+def _close_db(conn: sqlite3.Connection) -> None:
+    # Let SQLite refresh planner statistics it considers stale before the connection goes away.
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
+
+@contextmanager
+def get_db():
+    """Borrow a pooled connection to DB_PATH, returning it to the pool afterwards."""
+    path = str(DB_PATH)
+    generation = _db_pool_generation
+    conn = None
+    try:
+        pooled_path, pooled_generation, pooled = _db_pool.get_nowait()
+    except queue.Empty:
+        pass
+    else:
+        if pooled_path == path and pooled_generation == generation:
+            conn = pooled
+        else:
+            _close_db(pooled)
+    if conn is None:
+        conn = _open_db(path)
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        if generation != _db_pool_generation:
+            # The database was reset while this connection was out; it still points at the old file.
+            _close_db(conn)
+        else:
+            try:
+                _db_pool.put_nowait((path, generation, conn))
+            except queue.Full:
+                _close_db(conn)
+
+
+def _db_file_signature() -> tuple:
+    """Identify the current database contents by path plus main/WAL file mtime and size."""
+    signature: list = [str(DB_PATH)]
+    for path in (DB_PATH, Path(str(DB_PATH) + "-wal")):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _close_db_pool() -> None:
+    global _db_pool_generation
+    _db_pool_generation += 1
+    while True:
+        try:
+            _, _, conn = _db_pool.get_nowait()
+        except queue.Empty:
+            return
+        _close_db(conn)
+
+
 def row_to_dict(row):
     return dict(row) if row else None
 
@@ -112,11 +214,6 @@ def _require_db_exists():
         raise HTTPException(status_code=404, detail=f"Database not found: {DB_PATH}")
 
 
-def _require_file_exists(path: Path, label: str):
-    if not path.exists():
-        raise HTTPException(status_code=404, detail=f"{label} file not found: {path}")
-
-
 def _ensure_config_dir():
     try:
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -124,13 +221,89 @@ def _ensure_config_dir():
         raise HTTPException(status_code=500, detail=f"Unable to create config directory {CONFIG_DIR}: {exc}") from exc
 
 
+def _write_text_if_changed(path: Path, text: str) -> bool:
+    """Atomically replace `path` with `text` via a temp file; return False (no write) if it already matches."""
+    path = path.resolve()
+    data = text.encode("utf-8")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None and st.st_size == len(data) and path.read_bytes() == data:
+        return False
+    # A unique temp file per writer: concurrent PUTs run in the threadpool. mkstemp
+    # creates it 0600, so a secret is never readable before the chmod below.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        if st is not None:
+            os.chmod(tmp, st.st_mode & 0o7777)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return True
+
+
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+_TEXT_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
 def _decode_text_payload(payload: bytes, *, label: str) -> str:
-    for encoding in ("utf-8", "utf-16", "latin-1"):
-        try:
-            return payload.decode(encoding)
-        except UnicodeDecodeError:
-            continue
-    raise HTTPException(status_code=400, detail=f"Unable to decode {label} file as text")
+    for bom, encoding in _TEXT_BOMS:
+        if payload.startswith(bom):
+            try:
+                return payload.decode(encoding)
+            except UnicodeDecodeError as exc:
+                raise HTTPException(status_code=400, detail=f"Unable to decode {label} file as text") from exc
+    try:
+        return payload.decode("utf-8")
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so this is the final fallback
+        return payload.decode("latin-1")
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_RUN_TEXT = {f"{_W}tab": "\t", f"{_W}ptab": "\t", f"{_W}cr": "\n", f"{_W}noBreakHyphen": "-"}
+
+
+def _docx_paragraph_texts(payload: bytes) -> list[str]:
+    """Body paragraph texts of a .docx, matching python-docx's ``Paragraph.text``."""
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        root = ET.fromstring(archive.read("word/document.xml"))
+    body = root.find(f"{_W}body")
+    if body is None:
+        raise KeyError("word/document.xml has no body")
+    paragraphs = []
+    for para in body.iterfind(f"{_W}p"):
+        parts = []
+        for child in para:
+            if child.tag == f"{_W}r":
+                runs = (child,)
+            elif child.tag == f"{_W}hyperlink":
+                runs = child.iterfind(f"{_W}r")
+            else:
+                continue
+            for run in runs:
+                for item in run:
+                    if item.tag == f"{_W}t":
+                        parts.append(item.text or "")
+                    elif item.tag == f"{_W}br":
+                        if item.get(f"{_W}type", "textWrapping") == "textWrapping":
+                            parts.append("\n")
+                    else:
+                        parts.append(_DOCX_RUN_TEXT.get(item.tag, ""))
+        paragraphs.append("".join(parts))
+    return paragraphs
 
 
 def _extract_resume_text_from_upload(filename: str, content_type: str | None, payload: bytes) -> tuple[str, str]:
@@ -162,15 +335,10 @@ def _extract_resume_text_from_upload(filename: str, content_type: str | None, pa
 
     if suffix == ".docx":
         try:
-            from docx import Document
-        except ModuleNotFoundError as exc:
-            raise HTTPException(status_code=500, detail="Missing dependency python-docx, install python-docx in backend venv") from exc
-        try:
-            document = Document(io.BytesIO(payload))
-        except Exception as exc:
+            paragraphs = _docx_paragraph_texts(payload)
+        except (zipfile.BadZipFile, KeyError, ET.ParseError) as exc:
             raise HTTPException(status_code=400, detail=f"Invalid DOCX file: {exc}") from exc
-        paragraphs = [p.text for p in document.paragraphs if p.text]
-        return "docx", "\n".join(paragraphs)
+        return "docx", "\n".join(p for p in paragraphs if p)
 
     # suffix == ".pdf"
     try:
@@ -228,23 +396,53 @@ def _coerce_bool(value, *, source: str) -> bool:
     raise HTTPException(status_code=status, detail=f"Invalid boolean in {source}: {value!r}")
 
 
-def _read_env_value(path: Path, key: str) -> Optional[str]:
-    if not path.exists():
-        return None
-    pattern = re.compile(rf"^\s*(?:export\s+)?{re.escape(key)}\s*=\s*(.*)\s*$")
+_ENV_LINE_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=(.*)$")
+
+
+def _read_env_entries(path: Path) -> tuple[tuple[str | None, str, str], ...]:
+    """Return ``(key, value, raw_line)`` for each line of an env file; key is None for non-assignments."""
     try:
-        lines = path.read_text().splitlines()
+        st = path.stat()
+    except FileNotFoundError:
+        return ()
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed reading env file {path}: {exc}") from exc
+    return _parse_env_file(str(path), st.st_mtime_ns, st.st_size)
 
+
+@lru_cache(maxsize=4)
+def _parse_env_file(path_str: str, mtime_ns: int, size: int) -> tuple[tuple[str | None, str, str], ...]:
+    try:
+        lines = Path(path_str).read_text().splitlines()
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"Failed reading env file {path_str}: {exc}") from exc
+    entries = []
     for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        match = pattern.match(line)
-        if not match:
+        match = _ENV_LINE_RE.match(line)
+        if match:
+            entries.append((match.group(1), match.group(2).strip(), line))
+        else:
+            entries.append((None, "", line))
+    return tuple(entries)
+
+
+def _write_env_lines(path: Path, lines: list[str]) -> None:
+    payload = "\n".join(lines)
+    if lines:
+        payload += "\n"
+    try:
+        _write_text_if_changed(path, payload)
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"Failed writing env file {path}: {exc}") from exc
+    finally:
+        # A rewrite can keep the same size within one mtime tick.
+        _parse_env_file.cache_clear()
+
+
+def _read_env_value(path: Path, key: str) -> Optional[str]:
+    for entry_key, value, _ in _read_env_entries(path):
+        if entry_key != key:
             continue
-        value = match.group(1).strip()
         if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
             value = value[1:-1]
         return value
@@ -253,50 +451,24 @@ def _read_env_value(path: Path, key: str) -> Optional[str]:
 
 def _upsert_env_value(path: Path, key: str, value: str) -> None:
     _ensure_config_dir()
-    lines: list[str] = []
-    if path.exists():
-        try:
-            lines = path.read_text().splitlines()
-        except OSError as exc:
-            raise HTTPException(status_code=500, detail=f"Failed reading env file {path}: {exc}") from exc
-
-    pattern = re.compile(rf"^\s*(?:export\s+)?{re.escape(key)}\s*=")
     replaced = False
     out: list[str] = []
-    for line in lines:
-        if pattern.match(line):
+    for entry_key, _, line in _read_env_entries(path):
+        if entry_key == key:
             out.append(f"{key}={value}")
             replaced = True
         else:
             out.append(line)
     if not replaced:
         out.append(f"{key}={value}")
-
-    payload = "\n".join(out)
-    if out:
-        payload += "\n"
-    try:
-        path.write_text(payload)
-    except OSError as exc:
-        raise HTTPException(status_code=500, detail=f"Failed writing env file {path}: {exc}") from exc
+    _write_env_lines(path, out)
 
 
 def _remove_env_key(path: Path, key: str) -> None:
     if not path.exists():
         return
-    pattern = re.compile(rf"^\s*(?:export\s+)?{re.escape(key)}\s*=")
-    try:
-        lines = path.read_text().splitlines()
-    except OSError as exc:
-        raise HTTPException(status_code=500, detail=f"Failed reading env file {path}: {exc}") from exc
-    kept = [line for line in lines if not pattern.match(line)]
-    payload = "\n".join(kept)
-    if kept:
-        payload += "\n"
-    try:
-        path.write_text(payload)
-    except OSError as exc:
-        raise HTTPException(status_code=500, detail=f"Failed writing env file {path}: {exc}") from exc
+    kept = [line for entry_key, _, line in _read_env_entries(path) if entry_key != key]
+    _write_env_lines(path, kept)
 
 
 def _mask_key_hint(value: Optional[str]) -> str:
@@ -305,46 +477,49 @@ def _mask_key_hint(value: Optional[str]) -> str:
     return f"****{value[-4:]}"
 
 
-def _load_jobspy_boards_from_source() -> list[dict]:
-    if not JOBSPY_PATH.exists():
-        raise HTTPException(status_code=500, detail=f"JobSpy source file not found: {JOBSPY_PATH}")
+def _load_source_constant(path: Path, name: str):
+    """Return the literal assigned to module-level ``name`` in ``path``, or None if absent."""
+    try:
+        st = path.stat()
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=f"Source file for {name} not found: {path}") from exc
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"Failed reading source file {path}: {exc}") from exc
+    return _parse_source_constant(str(path), st.st_mtime_ns, st.st_size, name)
+
 
+@lru_cache(maxsize=4)
+def _parse_source_constant(path_str: str, mtime_ns: int, size: int, name: str):
+    # mtime_ns and size only key the cache so an edited source file is re-parsed.
+    path = Path(path_str)
     try:
-        source_text = JOBSPY_PATH.read_text()
+        source_text = path.read_text()
     except OSError as exc:
-        raise HTTPException(status_code=500, detail=f"Failed reading JobSpy source file {JOBSPY_PATH}: {exc}") from exc
+        raise HTTPException(status_code=500, detail=f"Failed reading source file {path}: {exc}") from exc
 
     try:
         tree = ast.parse(source_text)
     except SyntaxError as exc:
-        raise HTTPException(status_code=500, detail=f"Invalid Python syntax in {JOBSPY_PATH}: {exc}") from exc
+        raise HTTPException(status_code=500, detail=f"Invalid Python syntax in {path}: {exc}") from exc
 
-    raw = None
     for node in tree.body:
         if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "JOBSPY_BOARDS":
-                    try:
-                        raw = ast.literal_eval(node.value)
-                    except (SyntaxError, ValueError) as exc:
-                        raise HTTPException(
-                            status_code=500,
-                            detail=f"Invalid JOBSPY_BOARDS constant in {JOBSPY_PATH}: {exc}",
-                        ) from exc
-                    break
-            if raw is not None:
-                break
-        if isinstance(node, ast.AnnAssign):
-            if isinstance(node.target, ast.Name) and node.target.id == "JOBSPY_BOARDS":
-                try:
-                    raw = ast.literal_eval(node.value)
-                except (SyntaxError, ValueError) as exc:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Invalid JOBSPY_BOARDS constant in {JOBSPY_PATH}: {exc}",
-                    ) from exc
-                break
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        else:
+            continue
+        if not any(isinstance(target, ast.Name) and target.id == name for target in targets):
+            continue
+        try:
+            return ast.literal_eval(node.value)
+        except (SyntaxError, ValueError) as exc:
+            raise HTTPException(status_code=500, detail=f"Invalid {name} constant in {path}: {exc}") from exc
+    return None
 
+
+def _load_jobspy_boards_from_source() -> list[dict]:
+    raw = _load_source_constant(JOBSPY_PATH, "JOBSPY_BOARDS")
     if raw is None:
         raise HTTPException(status_code=500, detail=f"JOBSPY_BOARDS not found in {JOBSPY_PATH}")
     if not isinstance(raw, list):
@@ -368,45 +543,7 @@ def _load_jobspy_boards_from_source() -> list[dict]:
 
 
 def _load_pipeline_stages_from_source() -> list[str]:
-    if not PIPELINE_PATH.exists():
-        raise HTTPException(status_code=500, detail=f"Pipeline source file not found: {PIPELINE_PATH}")
-
-    try:
-        source_text = PIPELINE_PATH.read_text()
-    except OSError as exc:
-        raise HTTPException(status_code=500, detail=f"Failed reading pipeline source file {PIPELINE_PATH}: {exc}") from exc
-
-    try:
-        tree = ast.parse(source_text)
-    except SyntaxError as exc:
-        raise HTTPException(status_code=500, detail=f"Invalid Python syntax in {PIPELINE_PATH}: {exc}") from exc
-
-    raw = None
-    for node in tree.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "STAGE_ORDER":
-                    try:
-                        raw = ast.literal_eval(node.value)
-                    except (SyntaxError, ValueError) as exc:
-                        raise HTTPException(
-                            status_code=500,
-                            detail=f"Invalid STAGE_ORDER constant in {PIPELINE_PATH}: {exc}",
-                        ) from exc
-                    break
-            if raw is not None:
-                break
-        if isinstance(node, ast.AnnAssign):
-            if isinstance(node.target, ast.Name) and node.target.id == "STAGE_ORDER":
-                try:
-                    raw = ast.literal_eval(node.value)
-                except (SyntaxError, ValueError) as exc:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Invalid STAGE_ORDER constant in {PIPELINE_PATH}: {exc}",
-                    ) from exc
-                break
-
+    raw = _load_source_constant(PIPELINE_PATH, "STAGE_ORDER")
     if raw is None:
         raise HTTPException(status_code=500, detail=f"STAGE_ORDER not found in {PIPELINE_PATH}")
     if not isinstance(raw, (tuple, list)):
@@ -421,10 +558,23 @@ def _load_pipeline_stages_from_source() -> list[str]:
 
 
 def _load_profile_json_required() -> dict:
-    _require_file_exists(PROFILE_PATH, "Profile")
+    data = _load_profile_json()
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"Profile file not found: {PROFILE_PATH}")
+    return data
+
+
+def _load_profile_json() -> dict | None:
+    """Parse profile.json, or return None if it does not exist."""
+    try:
+        raw = PROFILE_PATH.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"Failed reading profile {PROFILE_PATH}: {exc}") from exc
     try:
-        data = json.loads(PROFILE_PATH.read_text())
-    except json.JSONDecodeError as exc:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise HTTPException(status_code=500, detail=f"Invalid JSON in {PROFILE_PATH}: {exc}") from exc
     if not isinstance(data, dict):
         raise HTTPException(status_code=500, detail=f"Profile JSON must be an object: {PROFILE_PATH}")
@@ -501,8 +651,16 @@ def _default_searches() -> dict:
 
 
 def _get_profile_min_score_default() -> int:
-    if not PROFILE_PATH.exists():
+    try:
+        st = PROFILE_PATH.stat()
+    except FileNotFoundError:
         return DEFAULT_MIN_SCORE
+    return _profile_min_score_at(str(PROFILE_PATH), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def _profile_min_score_at(path_str: str, mtime_ns: int, size: int) -> int:
+    # Arguments only key the cache; save_profile clears it after writing.
     data = _load_profile_json_required()
     raw = data.get("min_score")
     if raw is None:
@@ -510,6 +668,24 @@ def _get_profile_min_score_default() -> int:
     return _coerce_min_score(raw, source="profile")
 
 
+@lru_cache(maxsize=1)
+def _sites_config_at(mtime_ns: int | None) -> tuple[dict, tuple[set[str], list[str]], list]:
+    sites_cfg = load_sites_config()
+    if not isinstance(sites_cfg, dict):
+        # Leave the shape error for the caller to report
+        return sites_cfg, (set(), []), []
+    return sites_cfg, load_blocked_sites(), load_blocked_sso()
+
+
+def _sites_config():
+    """(sites config, blocked sites, blocked SSO), re-parsed only when sites.yaml has changed."""
+    try:
+        mtime_ns = (APPLYPILOT_CONFIG_DIR / "sites.yaml").stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _sites_config_at(mtime_ns)
+
+
 def _normalize_tail_count(raw_tail: Optional[int]) -> int:
     if raw_tail is None:
         return 200
@@ -522,8 +698,13 @@ def _normalize_tail_count(raw_tail: Optional[int]) -> int:
     return min(tail, 5000)
 
 
+_TIMESTAMP_RE = re.compile(r"^\s*(\d{4}-\d{2}-\d{2}[T ][0-9:.\-+Z]+)")
+
+
 def _extract_timestamp(line: str) -> str:
-    match = re.match(r"^\s*(\d{4}-\d{2}-\d{2}[T ][0-9:.\-+Z]+)", line or "")
+    if not line or not line.lstrip()[:1].isdigit():
+        return ""
+    match = _TIMESTAMP_RE.match(line)
     if not match:
         return ""
     raw = match.group(1).strip()
@@ -547,19 +728,23 @@ def _serialize_log_line(text: str, line_no: int) -> dict:
 
 
 def _append_pipeline_output_line(text: str, proc: Optional[subprocess.Popen] = None) -> None:
+    _append_pipeline_output_lines([text], proc)
+
+
+def _append_pipeline_output_lines(texts: list[str], proc: subprocess.Popen | None = None) -> None:
     global _pipeline_proc
-    clean = text.rstrip("\r\n")
-    if not clean:
+    cleaned = [clean for clean in (text.rstrip("\r\n") for text in texts) if clean]
+    if not cleaned:
         return
     with _pipeline_log_lock:
         if proc is not None and _pipeline_proc is not proc:
             return
-        lines = _pipeline_meta.setdefault("output_lines", [])
-        lines.append(clean)
-        if _pipeline_meta.get("output"):
-            _pipeline_meta["output"] = f"{_pipeline_meta['output']}\n{clean}"
-        else:
-            _pipeline_meta["output"] = clean
+        lines = _pipeline_meta["output_lines"]
+        # Keep absolute line numbers stable once the ring buffer starts evicting
+        overflow = len(lines) + len(cleaned) - lines.maxlen
+        if overflow > 0:
+            _pipeline_meta["output_dropped"] = _pipeline_meta.get("output_dropped", 0) + overflow
+        lines.extend(cleaned)
 
 
 def _capture_pipeline_output(proc: subprocess.Popen) -> None:
@@ -567,14 +752,15 @@ def _capture_pipeline_output(proc: subprocess.Popen) -> None:
     if stream is None:
         return
     try:
-        for raw in iter(stream.readline, ""):
-            if raw == "":
-                break
-            _append_pipeline_output_line(raw, proc)
-        leftover = stream.read()
-        if leftover:
-            for line in leftover.splitlines():
-                _append_pipeline_output_line(line, proc)
+        try:
+            fd = stream.fileno()
+        except (OSError, ValueError):
+            fd = None
+        if fd is None:
+            for raw in iter(stream.readline, ""):
+                _append_pipeline_output_line(raw, proc)
+        else:
+            _capture_pipeline_fd(fd, proc)
     except Exception as exc:
         _append_pipeline_output_line(f"[server] Failed reading pipeline output: {exc}", proc)
     finally:
@@ -584,26 +770,117 @@ def _capture_pipeline_output(proc: subprocess.Popen) -> None:
             pass
 
 
-def _start_pipeline_output_capture(proc: subprocess.Popen) -> None:
-    if proc.stdout is None:
+def _capture_pipeline_fd(fd: int, proc: subprocess.Popen) -> None:
+    # Read whatever the pipe has (up to 64 KiB) and append all complete lines under one lock.
+    pending = b""
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        # Mirror universal-newline text mode so carriage-return progress updates become lines.
+        pending += chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        complete, sep, pending = pending.rpartition(b"\n")
+        if sep:
+            _append_pipeline_output_lines(complete.decode("utf-8", errors="replace").split("\n"), proc)
+    if pending:
+        _append_pipeline_output_line(pending.decode("utf-8", errors="replace"), proc)
+
+
+def _spawn_pipeline_process(cmd: list[str], env: dict) -> subprocess.Popen:
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env=env,
+    )
+
+
+def _run_pipeline_chain(proc: subprocess.Popen, env: dict) -> None:
+    # Capture each process in turn; start the next queued command only after a clean exit.
+    global _pipeline_proc
+    while True:
+        _capture_pipeline_output(proc)
+        returncode = proc.wait()
+        with _pipeline_log_lock:
+            pending = _pipeline_meta.get("pending_commands")
+            if _pipeline_proc is not proc or returncode != 0 or not pending:
+                return
+            # Leave the command queued until it has spawned so _pipeline_active() never
+            # sees a clean exit with nothing left to run in between.
+            cmd = pending[0]
+            try:
+                proc = _spawn_pipeline_process(cmd, env)
+            except OSError as exc:
+                pending.clear()
+                _pipeline_meta["returncode"] = 127
+                error = exc
+            else:
+                pending.pop(0)
+                _pipeline_proc = proc
+                _pipeline_meta["finished_at"] = None
+                _pipeline_meta["returncode"] = None
+                _pipeline_meta["output_captured"] = False
+                continue
+        _append_pipeline_output_line(f"[server] Failed to start {shlex.join(cmd)}: {error}")
+        return
+
+
+def _start_pipeline_output_capture(proc: subprocess.Popen, env: dict | None = None) -> None:
+    if _pipeline_meta.get("pending_commands"):
+        target, args = _run_pipeline_chain, (proc, env)
+    elif proc.stdout is None:
         return
-    reader = threading.Thread(target=_capture_pipeline_output, args=(proc,), daemon=True)
+    else:
+        target, args = _capture_pipeline_output, (proc,)
+    reader = threading.Thread(target=target, args=args, daemon=True)
     reader.start()
 
 
-def _pipeline_lines_snapshot() -> list[str]:
+def _pipeline_active() -> bool:
+    """True while a pipeline process runs or a chained command is queued behind a clean exit."""
     with _pipeline_log_lock:
-        lines = _pipeline_meta.get("output_lines")
-        if not isinstance(lines, list):
-            return []
-        return list(lines)
+        proc = _pipeline_proc
+        pending = bool(_pipeline_meta.get("pending_commands"))
+    if proc is None:
+        return False
+    returncode = proc.poll()
+    return returncode is None or (returncode == 0 and pending)
+
+
+def _pipeline_lines_snapshot() -> tuple[int, list[str]]:
+    """Return ``(dropped, lines)``: retained output lines and how many older lines were evicted."""
+    with _pipeline_log_lock:
+        return _pipeline_meta.get("output_dropped", 0), list(_pipeline_meta["output_lines"])
+
+
+def _pipeline_line_count() -> int:
+    """Absolute number of output lines produced so far, without copying the buffer."""
+    with _pipeline_log_lock:
+        return _pipeline_meta.get("output_dropped", 0) + len(_pipeline_meta["output_lines"])
+
+
+def _pipeline_lines_window(since: int, limit: int) -> tuple[int, int, list[str]]:
+    """Return ``(start, total, lines)`` for at most ``limit`` lines from absolute line ``since``.
+
+    Only the requested window is copied out of the ring buffer; if more than
+    ``limit`` lines are available the newest ``limit`` are returned.
+    """
+    with _pipeline_log_lock:
+        lines = _pipeline_meta["output_lines"]
+        dropped = _pipeline_meta.get("output_dropped", 0)
+        total = dropped + len(lines)
+        # Lines before `dropped` have left the ring buffer; resume from the oldest retained one.
+        start = max(min(max(since, dropped), total), total - limit)
+        return start, total, list(islice(lines, start - dropped, None))
 
 
 def _refresh_pipeline_state() -> bool:
     global _pipeline_proc
     if _pipeline_proc is None:
         return False
-    running = _pipeline_proc.poll() is None
+    running = _pipeline_active()
     if not running:
         if not _pipeline_meta.get("output_captured"):
             stream = _pipeline_proc.stdout
@@ -623,54 +900,199 @@ def _refresh_pipeline_state() -> bool:
     return running
 
 
+def _scan_log_files(root: Path) -> list[tuple[Path, os.stat_result]]:
+    """Walk `root` recursively, statting each regular file exactly once."""
+    found: list[tuple[Path, os.stat_result]] = []
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.is_file():
+                    found.append((Path(entry.path), entry.stat()))
+    return found
+
+
+# path -> _LogCount. Logs are append-only, so later polls only count bytes
+# written since the last one. A file whose stat is unchanged is trusted as is;
+# otherwise it must not have shrunk, and both its first 64 KiB and the bytes
+# just before the cached offset must still match, which catches a log that was
+# truncated and rewritten in place. get_logs prunes entries for files that are
+# no longer listed, so rotated or deleted logs don't accumulate.
+class _LogCount(NamedTuple):
+    ino: int
+    size: int
+    mtime_ns: int
+    head_digest: bytes
+    offset: int
+    count: int
+    marker: bytes
+
+
+_log_newline_counts: dict[str, _LogCount] = {}
+_log_newline_counts_lock = threading.Lock()
+_LOG_HEAD_SAMPLE = 65536
+
+
+def _count_line_breaks(data: bytes) -> int:
+    # Universal newlines, as text-mode reads split: "\n", "\r\n" and a bare "\r" each end a line.
+    return data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+
+
+def _log_head_digest(handle) -> bytes:
+    handle.seek(0)
+    return hashlib.blake2b(handle.read(_LOG_HEAD_SAMPLE), digest_size=16).digest()
+
+
+def _count_newlines_before(handle, pos: int) -> int:
+    key = handle.name
+    st = os.fstat(handle.fileno())
+    offset, count, prev_cr = 0, 0, False
+    head_digest = None
+    # Only the dict lookups are locked; counting runs outside it. Two polls
+    # counting the same file concurrently each store an entry that is valid for
+    # what they read, so last-writer-wins is intended.
+    with _log_newline_counts_lock:
+        cached = _log_newline_counts.get(key)
+    if cached and cached.ino == st.st_ino and 0 < cached.offset <= pos and cached.size <= st.st_size:
+        if (cached.size, cached.mtime_ns) == (st.st_size, st.st_mtime_ns):
+            valid = True
+            head_digest = cached.head_digest
+        else:
+            head_digest = _log_head_digest(handle)
+            handle.seek(cached.offset - len(cached.marker))
+            valid = head_digest == cached.head_digest and handle.read(len(cached.marker)) == cached.marker
+        if valid:
+            offset, count, prev_cr = cached.offset, cached.count, cached.marker.endswith(b"\r")
+    if head_digest is None:
+        head_digest = _log_head_digest(handle)
+    handle.seek(offset)
+    remaining = pos - offset
+    while remaining > 0:
+        chunk = handle.read(min(1 << 20, remaining))
+        if not chunk:
+            break
+        count += _count_line_breaks(chunk)
+        if prev_cr and chunk.startswith(b"\n"):
+            # A "\r\n" split across reads was counted once per half.
+            count -= 1
+        prev_cr = chunk.endswith(b"\r")
+        remaining -= len(chunk)
+    handle.seek(max(0, pos - 64))
+    marker = handle.read(pos - max(0, pos - 64))
+    entry = _LogCount(st.st_ino, st.st_size, st.st_mtime_ns, head_digest, pos, count, marker)
+    with _log_newline_counts_lock:
+        _log_newline_counts[key] = entry
+    return count
+
+
+def _prune_log_newline_counts(keep: set[str]) -> None:
+    """Forget cached counts for log files that are no longer listed."""
+    with _log_newline_counts_lock:
+        for key in _log_newline_counts.keys() - keep:
+            del _log_newline_counts[key]
+
+
 def _tail_file_lines(path: Path, tail: int) -> tuple[int, list[dict]]:
-    total = 0
-    tail_rows: deque[tuple[int, str]] = deque(maxlen=tail)
     try:
-        with path.open("r", encoding="utf-8", errors="replace") as handle:
-            for total, raw in enumerate(handle, start=1):
-                tail_rows.append((total, raw.rstrip("\r\n")))
+        with path.open("rb") as handle:
+            # Read 64 KiB blocks backwards until the buffer holds more than `tail` line breaks.
+            end = handle.seek(0, os.SEEK_END)
+            pos = end
+            buf = b""
+            while pos > 0 and _count_line_breaks(buf) <= tail:
+                step = min(65536, pos)
+                pos -= step
+                handle.seek(pos)
+                buf = handle.read(step) + buf
+            if pos > 0 and buf.startswith(b"\n"):
+                # Never start the window between the halves of a "\r\n".
+                handle.seek(pos - 1)
+                if handle.read(1) == b"\r":
+                    pos -= 1
+                    buf = b"\r" + buf
+            head_newlines = _count_newlines_before(handle, pos)
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed reading log file {path}: {exc}") from exc
 
-    return total, [_serialize_log_line(text, line_no) for line_no, text in tail_rows]
+    if not end:
+        return 0, []
+    buf = buf.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    total = head_newlines + buf.count(b"\n")
+    raw_lines = buf.split(b"\n")
+    if buf.endswith(b"\n"):
+        raw_lines.pop()
+    else:
+        total += 1
+    if pos > 0:
+        # The first piece is the end of a line that started before the window.
+        raw_lines.pop(0)
+    tail_rows = raw_lines[-tail:]
+    first_line_no = total - len(tail_rows) + 1
+    return total, [
+        _serialize_log_line(raw.decode("utf-8", errors="replace"), line_no)
+        for line_no, raw in enumerate(tail_rows, start=first_line_no)
+    ]
+
+
+_JOBS_SCHEMA_SQL = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT,
+    salary TEXT,
+    location TEXT,
+    site TEXT,
+    strategy TEXT,
+    discovered_at TEXT,
+    description TEXT,
+    full_description TEXT,
+    application_url TEXT,
+    detail_error TEXT,
+    fit_score INTEGER,
+    score_reasoning TEXT,
+    scored_at TEXT,
+    tailored_resume_path TEXT,
+    tailored_at TEXT,
+    cover_letter_path TEXT,
+    cover_letter_at TEXT,
+    applied_at TEXT,
+    apply_status TEXT,
+    apply_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_fit_score ON jobs(fit_score);
+CREATE INDEX IF NOT EXISTS idx_jobs_discovered_at ON jobs(discovered_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_applied_at ON jobs(applied_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_site ON jobs(site);
+CREATE INDEX IF NOT EXISTS idx_jobs_fit_score_desc ON jobs(fit_score DESC, discovered_at DESC);
+-- Partial indexes matching the /api/jobs status filters
+CREATE INDEX IF NOT EXISTS idx_jobs_status_discovered ON jobs(discovered_at)
+    WHERE full_description IS NULL AND fit_score IS NULL;
+CREATE INDEX IF NOT EXISTS idx_jobs_status_enriched ON jobs(discovered_at)
+    WHERE full_description IS NOT NULL AND fit_score IS NULL;
+CREATE INDEX IF NOT EXISTS idx_jobs_status_scored ON jobs(discovered_at)
+    WHERE fit_score IS NOT NULL AND tailored_resume_path IS NULL;
+CREATE INDEX IF NOT EXISTS idx_jobs_status_tailored ON jobs(discovered_at)
+    WHERE tailored_resume_path IS NOT NULL AND applied_at IS NULL;
+-- Partial indexes backing /api/documents
+CREATE INDEX IF NOT EXISTS idx_jobs_tailored_resume_path ON jobs(tailored_resume_path)
+    WHERE tailored_resume_path IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_jobs_cover_letter_path ON jobs(cover_letter_path)
+    WHERE cover_letter_path IS NOT NULL;
+COMMIT;
+"""
 
 
 def _initialize_jobs_db():
     _ensure_config_dir()
     conn = sqlite3.connect(str(DB_PATH))
     try:
-        c = conn.cursor()
-        c.execute(
-            """CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                url TEXT UNIQUE NOT NULL,
-                title TEXT,
-                salary TEXT,
-                location TEXT,
-                site TEXT,
-                strategy TEXT,
-                discovered_at TEXT,
-                description TEXT,
-                full_description TEXT,
-                application_url TEXT,
-                detail_error TEXT,
-                fit_score INTEGER,
-                score_reasoning TEXT,
-                scored_at TEXT,
-                tailored_resume_path TEXT,
-                tailored_at TEXT,
-                cover_letter_path TEXT,
-                cover_letter_at TEXT,
-                applied_at TEXT,
-                apply_status TEXT,
-                apply_error TEXT
-            )"""
-        )
-        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_fit_score ON jobs(fit_score)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_discovered_at ON jobs(discovered_at)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_applied_at ON jobs(applied_at)")
-        conn.commit()
+        # journal_mode persists in the file, so every later connection starts in WAL.
+        # It cannot change inside a transaction, so set it before the schema script.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_JOBS_SCHEMA_SQL)
     except sqlite3.Error as exc:
         raise HTTPException(status_code=500, detail=f"Failed to initialize database {DB_PATH}: {exc}") from exc
     finally:
@@ -686,7 +1108,7 @@ async def serve_frontend():
 # ═══ STATS ═══
 
 @app.get("/api/stats")
-async def get_stats():
+def get_stats():
     if not DB_PATH.exists():
         return {
             "total": 0,
@@ -699,40 +1121,54 @@ async def get_stats():
             "last_discovered": None,
             "sources": {},
         }
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT COUNT(*) FROM jobs")
-    total = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM jobs WHERE full_description IS NOT NULL")
-    enriched = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM jobs WHERE fit_score IS NOT NULL")
-    scored = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM jobs WHERE fit_score >= ?", (DEFAULT_MIN_SCORE,))
-    scored_7plus = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM jobs WHERE tailored_resume_path IS NOT NULL")
-    tailored = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM jobs WHERE cover_letter_path IS NOT NULL")
-    cover_letters = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM jobs WHERE applied_at IS NOT NULL")
-    applied = c.fetchone()[0]
-    # Recent discovery time
-    c.execute("SELECT MAX(discovered_at) FROM jobs")
-    last_discovered = c.fetchone()[0]
-    # Source breakdown
-    c.execute("SELECT site, COUNT(*) as cnt FROM jobs GROUP BY site ORDER BY cnt DESC")
-    sources = {r["site"]: r["cnt"] for r in c.fetchall()}
-    conn.close()
-    return {
+    key = _db_file_signature()
+    with _stats_cache_lock:
+        if _stats_cache["key"] == key and time.monotonic() - _stats_cache["ts"] < STATS_CACHE_TTL:
+            return JSONResponse(_stats_cache["value"])
+    with get_db() as conn:
+        c = conn.cursor()
+        c.execute(
+            """SELECT COUNT(*),
+                      COALESCE(SUM(full_description IS NOT NULL), 0),
+                      COALESCE(SUM(fit_score IS NOT NULL), 0),
+                      COALESCE(SUM(fit_score >= ?), 0),
+                      COALESCE(SUM(tailored_resume_path IS NOT NULL), 0),
+                      COALESCE(SUM(cover_letter_path IS NOT NULL), 0),
+                      COALESCE(SUM(applied_at IS NOT NULL), 0),
+                      MAX(discovered_at)
+               FROM jobs""",
+            (DEFAULT_MIN_SCORE,),
+        )
+        (total, enriched, scored, scored_7plus, tailored,
+         cover_letters, applied, last_discovered) = c.fetchone()
+        # Source breakdown
+        c.execute("SELECT site, COUNT(*) as cnt FROM jobs GROUP BY site ORDER BY cnt DESC")
+        sources = {r["site"]: r["cnt"] for r in c.fetchall()}
+    stats = {
         "total": total, "enriched": enriched, "scored": scored,
         "scored_7plus": scored_7plus, "tailored": tailored, "cover_letters": cover_letters, "applied": applied,
         "last_discovered": last_discovered, "sources": sources
     }
+    with _stats_cache_lock:
+        _stats_cache.update(key=key, ts=time.monotonic(), value=stats)
+    # Plain JSON types only, so skip FastAPI's jsonable_encoder walk.
+    return JSONResponse(stats)
 
 
 # ═══ JOBS ═══
 
+# Mirrors the truthiness checks the jobs list used to apply per row in Python
+_JOB_STATUS_SQL = """CASE
+                           WHEN applied_at <> '' THEN 'applied'
+                           WHEN tailored_resume_path <> '' THEN 'tailored'
+                           WHEN fit_score IS NOT NULL THEN 'scored'
+                           WHEN full_description <> '' THEN 'enriched'
+                           ELSE 'discovered'
+                       END"""
+
+
 @app.get("/api/jobs")
-async def get_jobs(
+def get_jobs(
     search: str = "",
     min_score: Optional[int] = None,
     max_score: Optional[int] = None,
@@ -746,9 +1182,6 @@ async def get_jobs(
 ):
     if not DB_PATH.exists():
         return {"jobs": [], "total": 0}
-    conn = get_db()
-    c = conn.cursor()
-
     where_clauses = []
     params = []
 
@@ -789,146 +1222,207 @@ async def get_jobs(
     sort_order = "ASC" if order.lower() == "asc" else "DESC"
     nulls = "NULLS LAST" if sort_col == "fit_score" else ""
 
-    # Count total matching
-    c.execute(f"SELECT COUNT(*) FROM jobs {where}", params)
-    total = c.fetchone()[0]
-
-    # Fetch page
-    c.execute(
-        f"""SELECT url, title, salary, location, site, strategy, discovered_at,
-                   fit_score, score_reasoning, scored_at,
-                   tailored_resume_path, tailored_at,
-                   cover_letter_path, cover_letter_at,
-                   applied_at, apply_status, apply_error,
-                   full_description, application_url, detail_error
-            FROM jobs {where}
-            ORDER BY {sort_col} {sort_order} {nulls}
-            LIMIT ? OFFSET ?""",
-        params + [limit, offset]
-    )
-    jobs = [row_to_dict(r) for r in c.fetchall()]
+    with get_db() as conn:
+        c = conn.cursor()
+        # Count total matching
+        c.execute(f"SELECT COUNT(*) FROM jobs {where}", params)
+        total = c.fetchone()[0]
 
-    # Derive a status field for each job
+        # Fetch page
+        c.execute(
+            f"""SELECT url, title, salary, location, site, strategy, discovered_at,
+                       fit_score, score_reasoning, scored_at,
+                       tailored_resume_path, tailored_at,
+                       cover_letter_path, cover_letter_at,
+                       applied_at, apply_status, apply_error,
+                       full_description, application_url, detail_error,
+                       {_JOB_STATUS_SQL} AS status
+                FROM jobs {where}
+                ORDER BY {sort_col} {sort_order} {nulls}
+                LIMIT ? OFFSET ?""",
+            params + [limit, offset]
+        )
+        jobs = [row_to_dict(r) for r in c.fetchall()]
+
+    # Extract company from site for display; pages repeat a handful of sites
+    companies: dict[str, str] = {}
     for j in jobs:
-        if j.get("applied_at"):
-            j["status"] = "applied"
-        elif j.get("tailored_resume_path"):
-            j["status"] = "tailored"
-        elif j.get("fit_score") is not None:
-            j["status"] = "scored"
-        elif j.get("full_description"):
-            j["status"] = "enriched"
-        else:
-            j["status"] = "discovered"
-        # Extract company from title or site for display
-        j["company"] = j.get("site", "").replace("_", " ").title() if j.get("site") else ""
+        site_name = j.get("site")
+        if not site_name:
+            j["company"] = ""
+            continue
+        company = companies.get(site_name)
+        if company is None:
+            company = companies[site_name] = site_name.replace("_", " ").title()
+        j["company"] = company
 
-    conn.close()
-    return {"jobs": jobs, "total": total}
+    return JSONResponse({"jobs": jobs, "total": total})
+
+
+def _maybe_read_text(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return None
 
 
 @app.get("/api/jobs/detail")
-async def get_job_detail(url: str):
+def get_job_detail(url: str):
+    # Plain def: FastAPI runs it in the threadpool, keeping file reads off the event loop.
     _require_db_exists()
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT * FROM jobs WHERE url = ?", (url,))
-    job = row_to_dict(c.fetchone())
-    conn.close()
+    with get_db() as conn:
+        c = conn.cursor()
+        c.execute("SELECT * FROM jobs WHERE url = ?", (url,))
+        job = row_to_dict(c.fetchone())
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    # Read tailored resume if exists
-    if job.get("tailored_resume_path") and os.path.exists(job["tailored_resume_path"]):
-        with open(job["tailored_resume_path"]) as f:
-            job["tailored_resume_text"] = f.read()
-    # Read cover letter if exists
-    if job.get("cover_letter_path") and os.path.exists(job["cover_letter_path"]):
-        with open(job["cover_letter_path"]) as f:
-            job["cover_letter_text"] = f.read()
-    # Check for PDF versions
-    if job.get("tailored_resume_path"):
-        pdf_path = job["tailored_resume_path"].replace(".txt", ".pdf")
-        if os.path.exists(pdf_path):
+    # Read tailored resume / cover letter text and check for PDF versions
+    resume_path = job.get("tailored_resume_path")
+    if resume_path:
+        text = _maybe_read_text(resume_path)
+        if text is not None:
+            job["tailored_resume_text"] = text
+        if Path(resume_path.replace(".txt", ".pdf")).is_file():
             job["resume_pdf_available"] = True
-    if job.get("cover_letter_path"):
-        cl_pdf_path = job["cover_letter_path"].replace(".txt", ".pdf")
-        if os.path.exists(cl_pdf_path):
+    cover_path = job.get("cover_letter_path")
+    if cover_path:
+        text = _maybe_read_text(cover_path)
+        if text is not None:
+            job["cover_letter_text"] = text
+        if Path(cover_path.replace(".txt", ".pdf")).is_file():
             job["cover_letter_pdf_available"] = True
     return job
 
 
 @app.get("/api/documents")
-async def get_documents():
+def get_documents():
     """Return all jobs that have generated PDFs (resume or cover letter)."""
     if not DB_PATH.exists():
         return {"documents": []}
-    conn = get_db()
-    c = conn.cursor()
-    c.execute(
-        """SELECT url, title, site, tailored_resume_path, cover_letter_path
-           FROM jobs
-           WHERE tailored_resume_path IS NOT NULL OR cover_letter_path IS NOT NULL"""
-    )
+    with get_db() as conn:
+        c = conn.cursor()
+        # SQLite answers an OR of IS NOT NULL terms with a full scan; a rowid UNION
+        # lets each side search its partial index and keeps the old table order.
+        c.execute(
+            """SELECT url, title, site, tailored_resume_path, cover_letter_path
+               FROM jobs
+               WHERE rowid IN (
+                   SELECT rowid FROM jobs WHERE tailored_resume_path IS NOT NULL
+                   UNION
+                   SELECT rowid FROM jobs WHERE cover_letter_path IS NOT NULL
+               )
+               ORDER BY rowid"""
+        )
+        rows = c.fetchall()
+
+    # Generated documents share a few directories; list each once instead of stat-ing every PDF.
+    listings: dict[str, set[str]] = {}
+
+    def pdf_exists(path: str) -> bool:
+        directory, name = os.path.split(path)
+        names = listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    names = {e.name for e in entries}
+            except OSError:
+                names = set()
+            listings[directory] = names
+        return name in names
+
     docs = []
-    for row in c.fetchall():
+    for row in rows:
         j = row_to_dict(row)
         company = (j.get("site") or "").replace("_", " ").title()
         entry = {"url": j["url"], "title": j["title"], "company": company, "pdfs": []}
         if j.get("tailored_resume_path"):
             pdf_path = j["tailored_resume_path"].replace(".txt", ".pdf")
-            if os.path.exists(pdf_path):
+            if pdf_exists(pdf_path):
                 entry["pdfs"].append({"type": "resume", "path": pdf_path, "name": Path(pdf_path).name})
         if j.get("cover_letter_path"):
             cl_pdf = j["cover_letter_path"].replace(".txt", ".pdf")
-            if os.path.exists(cl_pdf):
+            if pdf_exists(cl_pdf):
                 entry["pdfs"].append({"type": "cover_letter", "path": cl_pdf, "name": Path(cl_pdf).name})
         if entry["pdfs"]:
             docs.append(entry)
-    conn.close()
-    return {"documents": docs}
+    return JSONResponse({"documents": docs})
 
 
 @app.get("/api/files/pdf")
-async def serve_pdf(path: str):
+def serve_pdf(path: str):
     """Serve a PDF file from the applypilot config directory."""
-    file_path = Path(path)
-    if not file_path.is_absolute():
-        file_path = CONFIG_DIR / path
-    if not str(file_path).startswith(str(CONFIG_DIR)):
+    config_dir = CONFIG_DIR.resolve()
+    # Resolve ".." and symlinks first; a lexical prefix check lets "<config>/../x.pdf" through.
+    file_path = (config_dir / path).resolve()
+    if not file_path.is_relative_to(config_dir):
         raise HTTPException(status_code=403, detail="Access denied")
     if not file_path.exists() or not file_path.suffix == ".pdf":
         raise HTTPException(status_code=404, detail="PDF not found")
+    if PDF_XACCEL_PREFIX:
+        rel = file_path.relative_to(config_dir)
+        return Response(
+            media_type="application/pdf",
+            headers={
+                "X-Accel-Redirect": PDF_XACCEL_PREFIX.rstrip("/") + "/" + quote(rel.as_posix()),
+                "Content-Disposition": f"attachment; filename*=utf-8''{quote(file_path.name)}",
+            },
+        )
     return FileResponse(file_path, media_type="application/pdf", filename=file_path.name)
 
 
 # ═══ BOARDS ═══
 
-@app.get("/api/boards")
-async def get_boards():
-    def normalize_key(value: str) -> str:
-        return re.sub(r"[^a-z0-9_]", "", str(value).strip().lower().replace("-", "_").replace(" ", "_"))
+_boards_cache: tuple[tuple, bytes] | None = None
+_BOARD_KEY_INVALID_RE = re.compile(r"[^a-z0-9_]")
+_BOARD_KEY_SEPARATORS = str.maketrans({"-": "_", " ": "_"})
 
-    sites_cfg = load_sites_config()
+
+def _normalize_board_key(value: object) -> str:
+    return _BOARD_KEY_INVALID_RE.sub("", str(value).strip().lower().translate(_BOARD_KEY_SEPARATORS))
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@app.get("/api/boards")
+def get_boards():
+    """Serve the boards payload, rebuilt only when sites.yaml or the JobSpy source changes."""
+    global _boards_cache
+    key = (str(JOBSPY_PATH), _stat_key(JOBSPY_PATH), _stat_key(APPLYPILOT_CONFIG_DIR / "sites.yaml"))
+    cached = _boards_cache
+    if cached is None or cached[0] != key:
+        cached = _boards_cache = (key, JSONResponse(_build_boards_payload()).body)
+    return Response(cached[1], media_type="application/json")
+
+
+def _build_boards_payload() -> dict:
+    sites_cfg, (blocked_sites_raw, blocked_url_patterns), blocked_sso = _sites_config()
     if not isinstance(sites_cfg, dict):
         raise HTTPException(status_code=500, detail="sites.yaml must parse as an object")
 
-    blocked_sites_raw, blocked_url_patterns = load_blocked_sites()
-    blocked_sites_map: dict[str, str] = {}
+    blocked_names: dict[str, str] = {}
     for item in blocked_sites_raw:
         text = str(item).strip()
-        if text:
-            blocked_sites_map[text.lower()] = text
-            blocked_sites_map[normalize_key(text)] = text
+        slug = _normalize_board_key(text)
+        if slug:
+            blocked_names[slug] = text
+    blocked_slugs = frozenset(blocked_names)
 
     boards_by_key: dict[str, dict] = {}
     board_order: list[str] = []
 
     def upsert_board(name: str, source: str, board_type: str, board_id: Optional[str] = None, url: Optional[str] = None):
         key = name.strip().lower()
-        slug = normalize_key(board_id or name)
+        slug = _normalize_board_key(board_id or name)
         if not key or not slug:
             return
-        is_blocked = key in blocked_sites_map or normalize_key(key) in blocked_sites_map or slug in blocked_sites_map
+        is_blocked = slug in blocked_slugs or _normalize_board_key(key) in blocked_slugs
         block_reason = "anti-bot protection"
 
         if slug not in boards_by_key:
@@ -982,8 +1476,8 @@ async def get_boards():
             url=str(url) if url else None,
         )
 
-    for key, original_name in blocked_sites_map.items():
-        if key in boards_by_key:
+    for slug, original_name in blocked_names.items():
+        if slug in boards_by_key:
             continue
         upsert_board(
             name=original_name,
@@ -996,7 +1490,6 @@ async def get_boards():
     if not isinstance(manual_ats, list):
         raise HTTPException(status_code=500, detail="sites.yaml field 'manual_ats' must be a list")
 
-    blocked_sso = load_blocked_sso()
     if not isinstance(blocked_sso, list):
         raise HTTPException(status_code=500, detail="sites.yaml field 'blocked_sso' must be a list")
 
@@ -1011,7 +1504,7 @@ async def get_boards():
 # ═══ CONFIG ═══
 
 @app.get("/api/config/defaults")
-async def get_config_defaults():
+def get_config_defaults():
     pipeline_stages_internal = _load_pipeline_stages_from_source()
     pipeline_stages: list[str] = []
     for stage in pipeline_stages_internal:
@@ -1037,20 +1530,21 @@ async def get_config_defaults():
 
 
 @app.get("/api/config/profile")
-async def get_profile():
-    if not PROFILE_PATH.exists():
+def get_profile():
+    data = _load_profile_json()
+    if data is None:
         return _default_profile()
-    data = _load_profile_json_required()
     data["min_score"] = _coerce_min_score(data.get("min_score", DEFAULT_MIN_SCORE), source="profile")
     data["onboarding"] = _normalize_onboarding(data.get("onboarding"), source="profile")
     for key, value in _default_profile().items():
         if key not in data:
             data[key] = value
-    return data
+    # Straight from json.loads, so already JSON-native: skip jsonable_encoder.
+    return JSONResponse(data)
 
 
 @app.put("/api/config/profile")
-async def save_profile(data: dict):
+def save_profile(data: dict):
     if not isinstance(data, dict):
         raise HTTPException(status_code=400, detail="Profile payload must be a JSON object")
     min_score = _coerce_min_score(data.get("min_score", DEFAULT_MIN_SCORE), source="request")
@@ -1060,18 +1554,20 @@ async def save_profile(data: dict):
     payload["onboarding"] = onboarding
     _ensure_config_dir()
     try:
-        PROFILE_PATH.write_text(json.dumps(payload, indent=2))
+        _write_text_if_changed(PROFILE_PATH, json.dumps(payload, indent=2))
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed writing profile to {PROFILE_PATH}: {exc}") from exc
-    return {"ok": True, "min_score": min_score, "onboarding": onboarding}
+    finally:
+        _profile_min_score_at.cache_clear()
+    return JSONResponse({"ok": True, "min_score": min_score, "onboarding": onboarding})
 
 
 @app.get("/api/config/searches")
-async def get_searches():
-    if not SEARCHES_PATH.exists():
-        return _default_searches()
+def get_searches():
     try:
-        loaded = yaml.safe_load(SEARCHES_PATH.read_text())
+        loaded = yaml_safe_load(SEARCHES_PATH.read_text())
+    except FileNotFoundError:
+        return _default_searches()
     except yaml.YAMLError as exc:
         raise HTTPException(status_code=500, detail=f"Invalid YAML in {SEARCHES_PATH}: {exc}") from exc
     if loaded is None:
@@ -1096,7 +1592,7 @@ async def get_searches():
 
 
 @app.put("/api/config/searches")
-async def save_searches(data: dict):
+def save_searches(data: dict):
     if not isinstance(data, dict):
         raise HTTPException(status_code=400, detail="Searches payload must be a JSON object")
     payload = dict(data)
@@ -1112,24 +1608,24 @@ async def save_searches(data: dict):
         payload["sites"] = list(payload["boards"])
     _ensure_config_dir()
     try:
-        SEARCHES_PATH.write_text(yaml.dump(payload, default_flow_style=False))
+        _write_text_if_changed(SEARCHES_PATH, yaml.dump(payload, default_flow_style=False, Dumper=_YAML_DUMPER))
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed writing searches to {SEARCHES_PATH}: {exc}") from exc
     return {"ok": True}
 
 
 @app.get("/api/config/resume")
-async def get_resume():
-    if not RESUME_PATH.exists():
-        return {"text": ""}
+def get_resume():
     try:
         return {"text": RESUME_PATH.read_text()}
+    except FileNotFoundError:
+        return {"text": ""}
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed reading resume file {RESUME_PATH}: {exc}") from exc
 
 
 @app.put("/api/config/resume")
-async def save_resume(data: dict):
+def save_resume(data: dict):
     if "text" not in data:
         raise HTTPException(status_code=400, detail="Missing required field: text")
     text = data["text"]
@@ -1143,6 +1639,20 @@ async def save_resume(data: dict):
     return {"ok": True, "chars": len(text)}
 
 
+def _store_uploaded_resume(filename: str, content_type: str | None, payload: bytes) -> tuple[str, str]:
+    file_type, extracted_text = _extract_resume_text_from_upload(filename, content_type, payload)
+    text = extracted_text.strip()
+    if not text:
+        raise HTTPException(status_code=400, detail="No extractable text found in uploaded resume")
+
+    _ensure_config_dir()
+    try:
+        RESUME_PATH.write_text(text)
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"Failed writing resume to {RESUME_PATH}: {exc}") from exc
+    return file_type, text
+
+
 @app.post("/api/config/resume/upload")
 async def upload_resume(file: UploadFile = File(...)):
     filename = (file.filename or "").strip()
@@ -1157,16 +1667,8 @@ async def upload_resume(file: UploadFile = File(...)):
     if not payload:
         raise HTTPException(status_code=400, detail="Uploaded file is empty")
 
-    file_type, extracted_text = _extract_resume_text_from_upload(filename, file.content_type, payload)
-    text = extracted_text.strip()
-    if not text:
-        raise HTTPException(status_code=400, detail="No extractable text found in uploaded resume")
-
-    _ensure_config_dir()
-    try:
-        RESUME_PATH.write_text(text)
-    except OSError as exc:
-        raise HTTPException(status_code=500, detail=f"Failed writing resume to {RESUME_PATH}: {exc}") from exc
+    # PDF/DOCX parsing is CPU-bound and the write blocks; keep both off the event loop.
+    file_type, text = await run_in_threadpool(_store_uploaded_resume, filename, file.content_type, payload)
 
     return {
         "ok": True,
@@ -1178,7 +1680,7 @@ async def upload_resume(file: UploadFile = File(...)):
 
 
 @app.get("/api/config/capsolver")
-async def get_capsolver_config():
+def get_capsolver_config():
     key = _read_env_value(ENV_PATH, "CAPSOLVER_API_KEY")
     return {
         "configured": bool(key),
@@ -1187,7 +1689,7 @@ async def get_capsolver_config():
 
 
 @app.put("/api/config/capsolver")
-async def save_capsolver_config(data: dict):
+def save_capsolver_config(data: dict):
     key = data.get("key") if isinstance(data, dict) else None
     if not isinstance(key, str) or not key.strip():
         raise HTTPException(status_code=400, detail="Field 'key' must be a non-empty string")
@@ -1201,7 +1703,7 @@ async def save_capsolver_config(data: dict):
 
 
 @app.get("/api/config/env")
-async def get_env_config():
+def get_env_config():
     key = _read_env_value(ENV_PATH, "CAPSOLVER_API_KEY") or ""
     return {
         "CAPSOLVER_API_KEY": key,
@@ -1212,7 +1714,7 @@ async def get_env_config():
 
 
 @app.put("/api/config/env")
-async def save_env_config(data: dict):
+def save_env_config(data: dict):
     if not isinstance(data, dict):
         raise HTTPException(status_code=400, detail="Env payload must be a JSON object")
     raw = data.get("CAPSOLVER_API_KEY", data.get("capsolver_api_key"))
@@ -1237,24 +1739,32 @@ async def save_env_config(data: dict):
 @app.get("/api/jobs/export")
 async def export_jobs_csv():
     _require_db_exists()
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("""SELECT url, title, salary, location, site, strategy, discovered_at,
-                        fit_score, score_reasoning, scored_at, applied_at, apply_status
-                 FROM jobs ORDER BY fit_score DESC NULLS LAST""")
-    rows = c.fetchall()
-    conn.close()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["URL", "Title", "Salary", "Location", "Source", "Strategy",
-                     "Discovered", "Score", "Score Reasoning", "Scored At", "Applied At", "Apply Status"])
-    for r in rows:
-        writer.writerow([r["url"], r["title"], r["salary"], r["location"], r["site"],
-                        r["strategy"], r["discovered_at"], r["fit_score"], r["score_reasoning"],
-                        r["scored_at"], r["applied_at"], r["apply_status"]])
-    output.seek(0)
+
+    # Sync generator: Starlette runs each step in the threadpool, so every blocking
+    # fetchmany happens off the event loop and only one batch is held in memory.
+    def iter_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["URL", "Title", "Salary", "Location", "Source", "Strategy",
+                         "Discovered", "Score", "Score Reasoning", "Scored At", "Applied At", "Apply Status"])
+        with get_db() as conn:
+            # Plain tuples: rows are only ever consumed positionally, so skip building sqlite3.Row objects.
+            c = conn.cursor()
+            c.row_factory = None
+            c.execute("""SELECT url, title, salary, location, site, strategy, discovered_at,
+                                fit_score, score_reasoning, scored_at, applied_at, apply_status
+                         FROM jobs ORDER BY fit_score DESC NULLS LAST""")
+            # Columns are selected in header order, so each batch goes straight to the C writer.
+            while rows := c.fetchmany(500):
+                writer.writerows(rows)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
     return StreamingResponse(
-        output, media_type="text/csv",
+        iter_csv(), media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=applypilot-jobs.csv"}
     )
 
@@ -1264,7 +1774,7 @@ async def export_jobs_csv():
 @app.post("/api/pipeline/run")
 async def run_pipeline(request: Request):
     global _pipeline_proc, _pipeline_meta
-    if _pipeline_proc and _pipeline_proc.poll() is None:
+    if _pipeline_active():
         return {"error": "Pipeline already running", "pid": _pipeline_proc.pid}
 
     stage_text = None
@@ -1356,19 +1866,13 @@ async def run_pipeline(request: Request):
         raise HTTPException(status_code=400, detail=f"Unsupported stage(s): {', '.join(unknown)}")
 
     env = _load_env()
+    pending_commands: list[list[str]] = []
     if includes_apply and not run_stages:
         cmd = [str(APPLYPILOT_BIN), "apply", "--min-score", str(resolved_min_score), "--workers", str(resolved_workers)]
         if resolved_dry_run:
             cmd.append("--dry-run")
         command_repr = " ".join(shlex.quote(part) for part in cmd)
-        _pipeline_proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            env=env,
-        )
+        _pipeline_proc = _spawn_pipeline_process(cmd, env)
     else:
         if not run_stages:
             run_stages = [default_stage]
@@ -1376,32 +1880,15 @@ async def run_pipeline(request: Request):
         run_cmd = [str(APPLYPILOT_BIN), "run"] + run_stages + ["--min-score", str(resolved_min_score), "--workers", str(resolved_workers)]
         if resolved_dry_run:
             run_cmd.append("--dry-run")
+        command_repr = " ".join(shlex.quote(part) for part in run_cmd)
         if includes_apply:
-            run_cmd_str = " ".join(shlex.quote(part) for part in run_cmd)
+            # Apply starts from the output-capture thread once `run` exits cleanly.
             apply_cmd = [str(APPLYPILOT_BIN), "apply", "--min-score", str(resolved_min_score), "--workers", str(resolved_workers)]
             if resolved_dry_run:
                 apply_cmd.append("--dry-run")
-            apply_cmd_str = " ".join(shlex.quote(part) for part in apply_cmd)
-            chained = f"{run_cmd_str} && {apply_cmd_str}"
-            command_repr = chained
-            _pipeline_proc = subprocess.Popen(
-                ["/bin/zsh", "-lc", chained],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                env=env,
-            )
-        else:
-            command_repr = " ".join(shlex.quote(part) for part in run_cmd)
-            _pipeline_proc = subprocess.Popen(
-                run_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                env=env,
-            )
+            pending_commands.append(apply_cmd)
+            command_repr = f"{command_repr} && {' '.join(shlex.quote(part) for part in apply_cmd)}"
+        _pipeline_proc = _spawn_pipeline_process(run_cmd, env)
 
     _pipeline_meta = {
         "stages": ",".join(requested),
@@ -1413,11 +1900,12 @@ async def run_pipeline(request: Request):
         "started_at": datetime.now(timezone.utc).isoformat(),
         "finished_at": None,
         "returncode": None,
-        "output": "",
-        "output_lines": [],
+        "output_lines": deque(maxlen=PIPELINE_OUTPUT_MAX_LINES),
+        "output_dropped": 0,
         "output_captured": False,
+        "pending_commands": pending_commands,
     }
-    _start_pipeline_output_capture(_pipeline_proc)
+    _start_pipeline_output_capture(_pipeline_proc, env)
     return {
         "ok": True,
         "pid": _pipeline_proc.pid,
@@ -1434,8 +1922,8 @@ async def run_pipeline(request: Request):
 async def pipeline_status():
     global _pipeline_proc, _pipeline_meta
     if _pipeline_proc is None:
-        output_lines = _pipeline_lines_snapshot()
-        return {
+        # Output itself is served incrementally by /api/logs/stream and in full by /api/pipeline/output.
+        return JSONResponse({
             "running": False,
             "pid": None,
             "stages": _pipeline_meta.get("stages"),
@@ -1446,12 +1934,10 @@ async def pipeline_status():
             "started_at": _pipeline_meta.get("started_at"),
             "finished_at": _pipeline_meta.get("finished_at"),
             "returncode": _pipeline_meta.get("returncode"),
-            "output": _pipeline_meta.get("output", ""),
-            "output_line_count": len(output_lines),
-        }
+            "output_line_count": _pipeline_line_count(),
+        })
     running = _refresh_pipeline_state()
-    output_lines = _pipeline_lines_snapshot()
-    return {
+    return JSONResponse({
         "running": running,
         "pid": _pipeline_proc.pid if _pipeline_proc else None,
         "stages": _pipeline_meta.get("stages"),
@@ -1462,20 +1948,25 @@ async def pipeline_status():
         "started_at": _pipeline_meta.get("started_at"),
         "finished_at": _pipeline_meta.get("finished_at"),
         "returncode": _pipeline_meta.get("returncode"),
-        "output": _pipeline_meta.get("output", ""),
-        "output_line_count": len(output_lines),
-    }
+        "output_line_count": _pipeline_line_count(),
+    })
+
+
+@app.get("/api/pipeline/output")
+async def pipeline_output():
+    _refresh_pipeline_state()
+    _, output_lines = _pipeline_lines_snapshot()
+    return PlainTextResponse("\n".join(output_lines))
 
 
 @app.get("/api/logs")
 async def get_logs(tail: int = Query(200)):
     resolved_tail = _normalize_tail_count(tail)
     running = _refresh_pipeline_state()
-    pipeline_lines_all = _pipeline_lines_snapshot()
-    pipeline_start = max(0, len(pipeline_lines_all) - resolved_tail)
+    pipeline_start, pipeline_total, pipeline_tail = _pipeline_lines_window(0, resolved_tail)
     pipeline_lines = [
         _serialize_log_line(line, idx + 1)
-        for idx, line in enumerate(pipeline_lines_all[pipeline_start:], start=pipeline_start)
+        for idx, line in enumerate(pipeline_tail, start=pipeline_start)
     ]
 
     log_files: list[dict] = []
@@ -1483,19 +1974,15 @@ async def get_logs(tail: int = Query(200)):
         if not LOGS_DIR.is_dir():
             raise HTTPException(status_code=500, detail=f"Logs path is not a directory: {LOGS_DIR}")
         try:
-            file_paths = [p for p in LOGS_DIR.rglob("*") if p.is_file()]
+            file_stats = _scan_log_files(LOGS_DIR)
         except OSError as exc:
             raise HTTPException(status_code=500, detail=f"Failed listing log files in {LOGS_DIR}: {exc}") from exc
-        try:
-            file_paths.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        except OSError as exc:
-            raise HTTPException(status_code=500, detail=f"Failed sorting log files in {LOGS_DIR}: {exc}") from exc
-        for path in file_paths:
-            try:
-                stats = path.stat()
-            except OSError as exc:
-                raise HTTPException(status_code=500, detail=f"Failed reading metadata for log file {path}: {exc}") from exc
-            total_lines, lines = _tail_file_lines(path, resolved_tail)
+        file_stats.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        _prune_log_newline_counts({str(path) for path, _ in file_stats})
+        tails = await asyncio.gather(*(
+            run_in_threadpool(_tail_file_lines, path, resolved_tail) for path, _ in file_stats
+        ))
+        for (path, stats), (total_lines, lines) in zip(file_stats, tails):
             log_files.append({
                 "name": path.name,
                 "path": str(path),
@@ -1505,7 +1992,7 @@ async def get_logs(tail: int = Query(200)):
                 "lines": lines,
             })
 
-    return {
+    return JSONResponse({
         "tail": resolved_tail,
         "pipeline": {
             "running": running,
@@ -1515,12 +2002,11 @@ async def get_logs(tail: int = Query(200)):
             "started_at": _pipeline_meta.get("started_at"),
             "finished_at": _pipeline_meta.get("finished_at"),
             "returncode": _pipeline_meta.get("returncode"),
-            "total_lines": len(pipeline_lines_all),
+            "total_lines": pipeline_total,
             "lines": pipeline_lines,
-            "output": _pipeline_meta.get("output", ""),
         },
         "log_files": log_files,
-    }
+    })
 
 
 @app.get("/api/logs/stream")
@@ -1529,22 +2015,13 @@ async def stream_logs(since: int = Query(0), tail: int = Query(200)):
         raise HTTPException(status_code=400, detail=f"since must be >= 0, got {since}")
     resolved_tail = _normalize_tail_count(tail)
     running = _refresh_pipeline_state()
-    pipeline_lines_all = _pipeline_lines_snapshot()
-    total = len(pipeline_lines_all)
-
-    start = min(since, total)
-    if start > total:
-        start = total
-    lines = pipeline_lines_all[start:]
-    if len(lines) > resolved_tail:
-        start = total - resolved_tail
-        lines = pipeline_lines_all[start:]
+    start, total, lines = _pipeline_lines_window(since, resolved_tail)
 
     payload_lines = [
         _serialize_log_line(line, idx + 1)
         for idx, line in enumerate(lines, start=start)
     ]
-    return {
+    return JSONResponse({
         "running": running,
         "pid": _pipeline_proc.pid if _pipeline_proc else None,
         "since": start,
@@ -1555,24 +2032,37 @@ async def stream_logs(since: int = Query(0), tail: int = Query(200)):
         "started_at": _pipeline_meta.get("started_at"),
         "finished_at": _pipeline_meta.get("finished_at"),
         "returncode": _pipeline_meta.get("returncode"),
-    }
+    })
 
 
 @app.post("/api/pipeline/stop")
 async def stop_pipeline():
     global _pipeline_proc, _pipeline_meta
-    if _pipeline_proc and _pipeline_proc.poll() is None:
-        _pipeline_proc.terminate()
+    if _pipeline_active():
+        # Drop queued commands first so the capture thread cannot start the next one.
+        with _pipeline_log_lock:
+            _pipeline_meta["pending_commands"] = []
+            proc = _pipeline_proc
+        if proc.poll() is None:
+            proc.terminate()
         _pipeline_meta["finished_at"] = datetime.now(timezone.utc).isoformat()
-        _pipeline_meta["returncode"] = _pipeline_proc.poll()
+        _pipeline_meta["returncode"] = proc.poll()
         return {"ok": True, "message": "Pipeline stopped"}
     return {"ok": True, "message": "No pipeline running"}
 
 
 # ═══ SYSTEM ═══
 
+@lru_cache(maxsize=32)
+def _which(name: str) -> str | None:
+    # PATH lookups stat every entry; installed tools don't change while the server runs.
+    return shutil.which(name)
+
+
 @app.get("/api/system/check")
-async def system_check():
+async def system_check(refresh: bool = Query(False)):
+    if refresh:
+        _which.cache_clear()
     checks = []
     # Python
     py_version = sys.version.split()[0]
@@ -1586,7 +2076,7 @@ async def system_check():
     checks.append({"name": "Searches", "detail": str(SEARCHES_PATH), "ok": SEARCHES_PATH.exists()})
     checks.append({"name": "Resume", "detail": str(RESUME_PATH), "ok": RESUME_PATH.exists()})
     # Gemini CLI
-    gemini_path = shutil.which("gemini")
+    gemini_path = _which("gemini")
     checks.append({
         "name": "Gemini CLI",
         "detail": gemini_path if gemini_path else "Not found on PATH",
@@ -1596,7 +2086,7 @@ async def system_check():
         "purpose": "Required for job scoring, resume tailoring, and cover letters",
     })
     # Claude Code CLI
-    claude_path = shutil.which("claude")
+    claude_path = _which("claude")
     checks.append({
         "name": "Claude Code CLI",
         "detail": claude_path if claude_path else "Not found on PATH",
@@ -1606,7 +2096,7 @@ async def system_check():
         "purpose": "Optional, needed only for auto-apply (browser automation)",
     })
     # Node.js (needed for both CLIs)
-    node_path = shutil.which("node")
+    node_path = _which("node")
     checks.append({
         "name": "Node.js",
         "detail": node_path if node_path else "Not found on PATH",
@@ -1619,7 +2109,7 @@ async def system_check():
 
 
 @app.post("/api/system/open-config")
-async def open_config_folder():
+def open_config_folder():
     _ensure_config_dir()
     target = str(CONFIG_DIR)
     try:
@@ -1628,7 +2118,7 @@ async def open_config_folder():
         elif os.name == "nt":
             subprocess.Popen(["explorer", target])
         else:
-            opener = shutil.which("xdg-open")
+            opener = _which("xdg-open")
             if not opener:
                 raise HTTPException(status_code=500, detail="Unable to open folder, xdg-open not found")
             subprocess.Popen([opener, target])
@@ -1640,10 +2130,11 @@ async def open_config_folder():
 @app.post("/api/system/reset-database")
 async def reset_database():
     global _pipeline_proc
-    if _pipeline_proc and _pipeline_proc.poll() is None:
+    if _pipeline_active():
         raise HTTPException(status_code=409, detail="Cannot reset database while pipeline is running")
     _ensure_config_dir()
 
+    _close_db_pool()
     backup_path = None
     if DB_PATH.exists():
         stamp = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -1671,8 +2162,8 @@ async def reset_database():
 
 
 @app.get("/api/system/checks")
-async def system_checks():
-    return await system_check()
+async def system_checks(refresh: bool = Query(False)):
+    return await system_check(refresh=refresh)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 import io
 import json
 import sqlite3
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
 import pytest
@@ -19,19 +22,26 @@ class FakeProcess:
         self._running = True
         self.returncode = None
         self.stdout = io.StringIO("")
+        self._exited = threading.Event()
 
     def poll(self):
         return None if self._running else self.returncode
 
+    def wait(self, timeout=None):
+        self._exited.wait(timeout)
+        return self.returncode
+
     def terminate(self):
         self._running = False
         if self.returncode is None:
             self.returncode = 143
+        self._exited.set()
 
     def finish(self, returncode=0, output=""):
         self._running = False
         self.returncode = returncode
         self.stdout = io.StringIO(output)
+        self._exited.set()
 
 
 @pytest.fixture()
@@ -60,7 +70,7 @@ def srv(monkeypatch, tmp_path):
         "finished_at": None,
         "returncode": None,
         "output": "",
-        "output_lines": [],
+        "output_lines": deque(maxlen=server.PIPELINE_OUTPUT_MAX_LINES),
         "output_captured": False,
     }
     return server
@@ -191,6 +201,20 @@ def test_stats_with_db(client, srv, tmp_path):
     assert data["applied"] == 1
 
 
+def test_stats_cache_invalidated_by_db_write(client, srv, tmp_path):
+    seed_jobs_db(srv, tmp_path)
+    assert client.get("/api/stats").json()["total"] == 2
+
+    conn = sqlite3.connect(srv.DB_PATH)
+    conn.execute("INSERT INTO jobs (url, title, site) VALUES (?, ?, ?)", ("https://example.com/job-3", "QA", "indeed"))
+    conn.commit()
+    conn.close()
+
+    data = client.get("/api/stats").json()
+    assert data["total"] == 3
+    assert data["sources"]["indeed"] == 2
+
+
 def test_jobs_without_db_returns_empty(client):
     resp = client.get("/api/jobs")
     assert resp.status_code == 200
@@ -224,6 +248,17 @@ def test_job_detail_not_found(client, srv, tmp_path):
     assert resp.status_code == 404
 
 
+def test_documents_lists_existing_pdfs(client, srv, tmp_path):
+    seed_jobs_db(srv, tmp_path)
+    (tmp_path / "tailored.pdf").write_bytes(b"%PDF-1.4")
+
+    resp = client.get("/api/documents")
+    assert resp.status_code == 200
+    docs = resp.json()["documents"]
+    assert [d["url"] for d in docs] == ["https://example.com/job-1"]
+    assert docs[0]["pdfs"] == [{"type": "resume", "path": str(tmp_path / "tailored.pdf"), "name": "tailored.pdf"}]
+
+
 def test_boards_endpoint(client):
     resp = client.get("/api/boards")
     assert resp.status_code == 200
@@ -280,6 +315,40 @@ def test_searches_get_default_and_put_syncs_boards_sites(client, srv):
     assert saved["sites"] == ["indeed", "linkedin"]
 
 
+def test_config_writes_skip_unchanged_and_keep_mode(client, srv):
+    client.put("/api/config/searches", json={"boards": ["indeed"]})
+    first = srv.SEARCHES_PATH.stat()
+    client.put("/api/config/searches", json={"boards": ["indeed"]})
+    assert srv.SEARCHES_PATH.stat().st_ino == first.st_ino
+    assert srv.SEARCHES_PATH.stat().st_mtime_ns == first.st_mtime_ns
+
+    srv.ENV_PATH.write_text("A=1\n")
+    srv.ENV_PATH.chmod(0o600)
+    assert client.put("/api/config/env", json={"CAPSOLVER_API_KEY": "abc"}).status_code == 200
+    assert srv.ENV_PATH.stat().st_mode & 0o777 == 0o600
+    assert "CAPSOLVER_API_KEY=abc" in srv.ENV_PATH.read_text()
+    assert not list(srv.CONFIG_DIR.glob(".env.*"))
+
+    payloads = ["short\n", "a much longer payload line\n" * 50]
+    errors = []
+
+    def writer(text):
+        try:
+            for _ in range(50):
+                srv._write_text_if_changed(srv.PROFILE_PATH, text)
+        except OSError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(payloads[i % 2],)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert srv.PROFILE_PATH.read_text() in payloads
+    assert not list(srv.CONFIG_DIR.glob("profile.json.*"))
+
+
 def yaml_safe_load(text):
     import yaml
 
@@ -331,6 +400,37 @@ def test_jobs_export_csv(client, srv, tmp_path):
     assert "URL,Title" in resp.text
 
 
+def test_serve_pdf_direct_and_xaccel(client, srv, monkeypatch):
+    pdf = srv.CONFIG_DIR / "tailored" / "My Resume.pdf"
+    pdf.parent.mkdir()
+    pdf.write_bytes(b"%PDF-1.4 test")
+
+    direct = client.get("/api/files/pdf", params={"path": str(pdf)})
+    assert direct.status_code == 200
+    assert direct.content == b"%PDF-1.4 test"
+
+    monkeypatch.setattr(srv, "PDF_XACCEL_PREFIX", "/protected-pdfs/")
+    accel = client.get("/api/files/pdf", params={"path": "tailored/My Resume.pdf"})
+    assert accel.status_code == 200
+    assert accel.content == b""
+    assert accel.headers["x-accel-redirect"] == "/protected-pdfs/tailored/My%20Resume.pdf"
+    assert accel.headers["content-type"] == "application/pdf"
+
+
+def test_serve_pdf_rejects_paths_escaping_config_dir(client, srv, monkeypatch, tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    monkeypatch.setattr(srv, "CONFIG_DIR", config_dir)
+    (tmp_path / "outside.pdf").write_bytes(b"%PDF-1.4 secret")
+
+    for prefix in ("", "/protected-pdfs/"):
+        monkeypatch.setattr(srv, "PDF_XACCEL_PREFIX", prefix)
+        for path in (f"{config_dir}/../outside.pdf", "../outside.pdf"):
+            resp = client.get("/api/files/pdf", params={"path": path})
+            assert resp.status_code == 403
+            assert "x-accel-redirect" not in resp.headers
+
+
 def test_pipeline_run_form_body_reads_stages(client, popen_spy):
     resp = client.post(
         "/api/pipeline/run",
@@ -385,7 +485,9 @@ def test_pipeline_status_and_stop(client, popen_spy, srv):
     complete = client.get("/api/pipeline/status")
     assert complete.status_code == 200
     assert complete.json()["running"] is False
-    assert "done output" in complete.json()["output"]
+    assert complete.json()["output_line_count"] == 1
+    assert "output" not in complete.json()
+    assert client.get("/api/pipeline/output").text == "done output"
 
     # restart then stop
     client.post("/api/pipeline/run", data={"stages": "score"})
@@ -394,6 +496,60 @@ def test_pipeline_status_and_stop(client, popen_spy, srv):
     assert stopped.json()["ok"] is True
 
 
+def test_pipeline_apply_chains_after_clean_run(client, popen_spy, srv, monkeypatch):
+    spy_popen = srv.subprocess.Popen
+    spawning = threading.Event()
+    release = threading.Event()
+
+    def slow_popen(cmd, *args, **kwargs):
+        if cmd[1] == "apply" and not release.is_set():
+            spawning.set()
+            release.wait(2)
+        return spy_popen(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(srv.subprocess, "Popen", slow_popen)
+    run = client.post("/api/pipeline/run", data={"stages": "score,apply"})
+    assert run.status_code == 200
+    assert " && " in run.json()["command"]
+    assert popen_spy[0].cmd[1] == "run"
+
+    popen_spy[0].finish(returncode=0)
+    assert spawning.wait(2)
+    # Requests made while apply is still spawning must see the pipeline as running
+    threading.Timer(0.1, release.set).start()
+    status = client.get("/api/pipeline/status").json()
+    assert status["running"] is True
+    assert status["returncode"] is None
+    assert status["finished_at"] is None
+    assert client.post("/api/pipeline/run", data={"stages": "score"}).json()["error"] == "Pipeline already running"
+    assert popen_spy[1].cmd[1] == "apply"
+    assert len(popen_spy) == 2
+    assert client.get("/api/pipeline/status").json()["pid"] == popen_spy[1].pid
+
+    popen_spy[1].finish(returncode=1)
+    status = client.get("/api/pipeline/status").json()
+    assert status["running"] is False
+    assert status["returncode"] == 1
+
+    client.post("/api/pipeline/run", data={"stages": "score,apply"})
+    popen_spy[2].finish(returncode=0)
+    deadline = time.monotonic() + 2
+    while len(popen_spy) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert popen_spy[3].cmd[1] == "apply"
+
+    stopped = client.post("/api/pipeline/stop")
+    assert stopped.json()["message"] == "Pipeline stopped"
+    assert popen_spy[3].returncode == 143
+
+    client.post("/api/pipeline/run", data={"stages": "score,apply"})
+    popen_spy[4].finish(returncode=1)
+    status = client.get("/api/pipeline/status").json()
+    assert status["running"] is False
+    assert status["returncode"] == 1
+    assert len(popen_spy) == 5
+
+
 def test_logs_endpoint_includes_pipeline_and_files(client, srv):
     srv._pipeline_meta = {
         "stages": "score",
@@ -402,7 +558,7 @@ def test_logs_endpoint_includes_pipeline_and_files(client, srv):
         "finished_at": "2026-02-20T00:02:00+00:00",
         "returncode": 0,
         "output": "line1\nline2\nline3",
-        "output_lines": ["line1", "line2", "line3"],
+        "output_lines": deque(["line1", "line2", "line3"], maxlen=srv.PIPELINE_OUTPUT_MAX_LINES),
         "output_captured": True,
     }
     srv.LOGS_DIR.mkdir(parents=True, exist_ok=True)
@@ -422,6 +578,47 @@ def test_logs_endpoint_includes_pipeline_and_files(client, srv):
     assert [line["text"] for line in file_payload["lines"]] == ["error: bad thing happened", "trace line"]
 
 
+def test_log_file_tail_uses_universal_newlines(srv, tmp_path):
+    log = tmp_path / "progress.log"
+    log.write_bytes(b"a\rb\rc\n")
+    total, lines = srv._tail_file_lines(log, 2)
+    assert total == 3
+    assert [(line["line_no"], line["text"]) for line in lines] == [(2, "b"), (3, "c")]
+
+    log.write_bytes(b"one\r\ntwo\rthree")
+    total, lines = srv._tail_file_lines(log, 5)
+    assert total == 3
+    assert [line["text"] for line in lines] == ["one", "two", "three"]
+
+
+def test_log_file_tail_recounts_after_in_place_rewrite(srv, tmp_path):
+    log = tmp_path / "rewritten.log"
+    log.write_text("ab\n" * 50000)
+    assert srv._tail_file_lines(log, 5)[0] == 50000
+
+    # Same inode and same trailing bytes, but fewer lines before the old offset
+    with log.open("r+") as handle:
+        handle.truncate(0)
+        handle.write("x" * 39998 + "\n" + "ab\n" * 40000)
+    assert srv._tail_file_lines(log, 5)[0] == 40001
+
+
+def test_logs_endpoint_prunes_line_counts_for_removed_files(client, srv):
+    srv.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    kept = srv.LOGS_DIR / "kept.log"
+    rotated = srv.LOGS_DIR / "rotated.log"
+    for path in (kept, rotated):
+        path.write_text("ab\n" * 50000)
+
+    assert client.get("/api/logs?tail=5").status_code == 200
+    assert {str(kept), str(rotated)} <= srv._log_newline_counts.keys()
+
+    rotated.unlink()
+    assert client.get("/api/logs?tail=5").status_code == 200
+    assert str(kept) in srv._log_newline_counts
+    assert str(rotated) not in srv._log_newline_counts
+
+
 def test_logs_stream_since_cursor(client, srv):
     srv._pipeline_meta = {
         "stages": "score",
@@ -430,7 +627,7 @@ def test_logs_stream_since_cursor(client, srv):
         "finished_at": "2026-02-20T00:02:00+00:00",
         "returncode": 0,
         "output": "a\nb\nc\nd",
-        "output_lines": ["a", "b", "c", "d"],
+        "output_lines": deque(["a", "b", "c", "d"], maxlen=srv.PIPELINE_OUTPUT_MAX_LINES),
         "output_captured": True,
     }
 
@@ -442,14 +639,42 @@ def test_logs_stream_since_cursor(client, srv):
     assert [line["text"] for line in body["lines"]] == ["c", "d"]
 
 
+def test_logs_stream_keeps_absolute_numbers_after_eviction(client, srv):
+    srv._pipeline_meta["output_lines"] = deque(maxlen=3)
+    srv._append_pipeline_output_lines(["a", "b", "c", "d", "e"])
+
+    resp = client.get("/api/logs/stream?since=1&tail=10")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["since"] == 2
+    assert body["next_since"] == 5
+    assert [(line["line_no"], line["text"]) for line in body["lines"]] == [(3, "c"), (4, "d"), (5, "e")]
+
+    body = client.get("/api/logs/stream?since=0&tail=2").json()
+    assert body["since"] == 3
+    assert [(line["line_no"], line["text"]) for line in body["lines"]] == [(4, "d"), (5, "e")]
+
+    pipeline = client.get("/api/logs?tail=2").json()["pipeline"]
+    assert pipeline["total_lines"] == 5
+    assert [(line["line_no"], line["text"]) for line in pipeline["lines"]] == [(4, "d"), (5, "e")]
+    assert client.get("/api/pipeline/status").json()["output_line_count"] == 5
+
+
 def test_system_check_and_alias(client, monkeypatch, srv):
     monkeypatch.setattr(srv.shutil, "which", lambda name: "/usr/bin/gemini" if name == "gemini" else None)
-    resp = client.get("/api/system/check")
+    resp = client.get("/api/system/check", params={"refresh": 1})
     assert resp.status_code == 200
     checks = resp.json()["checks"]
     gemini = next(c for c in checks if c["name"] == "Gemini CLI")
     assert gemini["ok"] is True
 
+    # Lookups are cached until the next refresh
+    monkeypatch.setattr(srv.shutil, "which", lambda name: None)
+    cached = next(c for c in client.get("/api/system/check").json()["checks"] if c["name"] == "Gemini CLI")
+    assert cached["ok"] is True
+    refreshed = client.get("/api/system/check", params={"refresh": "true"}).json()["checks"]
+    assert next(c for c in refreshed if c["name"] == "Gemini CLI")["ok"] is False
+
     alias = client.get("/api/system/checks")
     assert alias.status_code == 200
     assert "checks" in alias.json()
@@ -483,6 +708,19 @@ def test_system_reset_database_success(client, srv):
     assert Path(body["path"]).exists()
 
 
+def test_system_reset_database_drops_connections_borrowed_during_reset(client, srv, tmp_path):
+    seed_jobs_db(srv, tmp_path)
+    assert client.get("/api/jobs").json()["total"] == 2
+
+    with srv.get_db() as conn:
+        conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        assert client.post("/api/system/reset-database").status_code == 200
+
+    # The connection borrowed across the reset must not be reused for the new database
+    for _ in range(srv._DB_POOL_SIZE + 1):
+        assert client.get("/api/jobs").json()["total"] == 0
+
+
 def test_system_reset_database_conflict_when_pipeline_running(client, srv):
     srv._pipeline_proc = FakeProcess(["dummy"])
     resp = client.post("/api/system/reset-database")
@@ -0,0 +1,48 @@
+from applypilot.scoring.validator import validate_tailored_resume, validate_tailored_resumes
+
+PROFILE = {
+    "personal": {"full_name": "Jane Doe", "email": "jane@example.com", "phone": "555-0100"},
+    "resume_facts": {
+        "preserved_companies": ["Acme Corp"],
+        "preserved_projects": ["Rocket"],
+        "preserved_school": "State University",
+    },
+    "skills_boundary": {"languages": ["Python", "SQL"]},
+}
+
+ORIGINAL = "Jane Doe\nSUMMARY\nEngineer at Acme Corp. Built Rocket. State University.\n"
+
+GOOD = (
+    "Jane Doe\njane@example.com | 555-0100\n"
+    "SUMMARY\nBackend engineer.\n"
+    "TECHNICAL SKILLS\nPython, SQL\n"
+    "EXPERIENCE\nAcme Corp: platform work.\n"
+    "PROJECTS\nRocket\n"
+    "EDUCATION\nState University\n"
+)
+
+
+def _candidates():
+    return [
+        GOOD,
+        GOOD.replace("Backend engineer.", "Backend engineer — shipped things."),
+        GOOD.replace("Python, SQL", "Python, SQL, Kubernetes"),
+        GOOD.replace("Acme Corp", "Other Co"),
+        GOOD + "EXPERIENCE\nAcme Corp again.\n",
+        "Jane Doe\nSUMMARY\nNothing else here.\n",
+        GOOD.replace("Backend engineer.", "Here is the tailored resume. Backend engineer."),
+    ]
+
+
+def test_batch_validation_matches_single_calls_inline():
+    texts = _candidates()[:4]
+    expected = [validate_tailored_resume(t, PROFILE, ORIGINAL) for t in texts]
+    assert validate_tailored_resumes(texts, PROFILE, ORIGINAL) == expected
+
+
+def test_batch_validation_matches_single_calls_in_worker_pool():
+    texts = _candidates()
+    expected = [validate_tailored_resume(t, PROFILE, ORIGINAL) for t in texts]
+    assert len(texts) > 4
+    assert validate_tailored_resumes(texts, PROFILE, ORIGINAL, workers=2) == expected
+    assert {result["passed"] for result in expected} == {True, False}
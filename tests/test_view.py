@@ -0,0 +1,43 @@
+import threading
+
+import pytest
+
+from applypilot.view import _prefetch
+
+
+class FailingCursor:
+    def __init__(self, exc):
+        self.exc = exc
+        self.calls = 0
+
+    def fetchmany(self, size):
+        self.calls += 1
+        if self.calls == 1:
+            return [(1,), (2,)]
+        raise self.exc
+
+
+def _drain_with_deadline(cursor):
+    outcome = {}
+
+    def run():
+        rows = []
+        try:
+            for row in _prefetch(cursor):
+                rows.append(row)
+        except BaseException as exc:
+            outcome["error"] = exc
+        outcome["rows"] = rows
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive(), "prefetch consumer hung"
+    return outcome
+
+
+@pytest.mark.parametrize("exc", [TypeError("bad converter"), MemoryError()])
+def test_prefetch_raises_non_sqlite_errors_from_the_cursor(exc):
+    outcome = _drain_with_deadline(FailingCursor(exc))
+    assert outcome["rows"] == [(1,), (2,)]
+    assert outcome["error"] is exc